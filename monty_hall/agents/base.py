@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from monty_hall.env.monty import State, StepResult, Result, Action
 from typing import Any
 
-@dataclass
+@dataclass(slots=True)
 class ActionSetup:
     action_name: Action
     arguments: list[Any] = field(default_factory=list) # type: ignore
@@ -0,0 +1,38 @@
+"""
+Decides when a tabular agent has finished learning.
+
+With a constant learning rate and 0/100 rewards the Q-values never stop moving,
+so the main signal is policy stability: the greedy action of every updated key
+staying the same for `window` games in a row. A `max_q_delta` tolerance can be
+added on top for schedules where the updates do shrink.
+"""
+
+
+class ConvergenceMonitor:
+    def __init__(self, window: int = 1000, max_q_delta: float | None = None, min_games: int = 0):
+        if window < 1:
+            raise ValueError("Window must be positive")
+        self.window = window
+        self.max_q_delta = max_q_delta
+        self.min_games = min_games
+        self.games = 0
+        self.stable_games = 0
+        self._game_q_delta = 0.0
+        self._game_policy_changed = False
+
+    def observe_update(self, old_value: float, new_value: float, policy_changed: bool) -> None:
+        self._game_q_delta = max(self._game_q_delta, abs(new_value - old_value))
+        self._game_policy_changed = self._game_policy_changed or policy_changed
+
+    def end_game(self) -> bool:
+        """
+        Close the current game and return whether learning has converged.
+        """
+        self.games += 1
+        stable = not self._game_policy_changed
+        if self.max_q_delta is not None:
+            stable = stable and self._game_q_delta <= self.max_q_delta
+        self.stable_games = self.stable_games + 1 if stable else 0
+        self._game_q_delta = 0.0
+        self._game_policy_changed = False
+        return self.games >= self.min_games and self.stable_games >= self.window
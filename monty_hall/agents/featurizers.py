@@ -0,0 +1,26 @@
+"""
+Featurizers turn an observation into the key an RL agent stores values under.
+
+Keying on the full `State` learns separately for every combination of opened
+doors, so the table grows combinatorially with the door count. The count based
+featurizers only keep what matters for the switch decision, which bounds the
+table to O(door_count) keys and shares learning across door identities.
+"""
+from collections.abc import Callable, Hashable
+from monty_hall.env.monty import State
+
+
+# Called with the observation and whether the agent has switched this game.
+Featurizer = Callable[[State, bool], Hashable]
+
+
+def full_state(observation: State, has_switched: bool) -> Hashable:
+    return observation
+
+
+def door_counts(observation: State, has_switched: bool) -> Hashable:
+    return (len(observation.available_doors), len(observation.open_doors))
+
+
+def door_counts_and_switched(observation: State, has_switched: bool) -> Hashable:
+    return (len(observation.available_doors), len(observation.open_doors), has_switched)
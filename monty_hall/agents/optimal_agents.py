@@ -0,0 +1,144 @@
+"""
+Exact solver for the classic Monty decision process.
+
+The state of a game is abstracted to the number of closed doors and the
+probability that the currently selected door hides the prize. The classic host
+never opens the selected door, so staying keeps that probability, while
+switching to one of the other `closed_doors - 1` doors moves it to
+`(1 - p) / (closed_doors - 1)` on average. Whether the pick has been re-picked
+is folded into that probability rather than tracked as a separate flag.
+
+For policies that only look at those two numbers every transition is affine in
+`p`, so the value of each level is the upper envelope of a few lines. Levels are
+memoized bottom-up and shared between door counts, which keeps the solver linear
+in `door_count`.
+"""
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from monty_hall.agents.base import BaseAgent, Action, ActionSetup
+from monty_hall.env.monty import State
+
+
+# A line `slope * p + intercept` in the value envelope of one level.
+Line = tuple[Fraction, Fraction]
+
+_ZERO = Fraction(0)
+_ONE = Fraction(1)
+
+
+@dataclass(frozen=True)
+class Solution:
+    door_count: int
+    value: Fraction
+    policy: dict[int, Action]
+
+
+def _intersection(first: Line, second: Line) -> Fraction:
+    return (first[1] - second[1]) / (second[0] - first[0])
+
+
+def _upper_envelope(lines: list[Line]) -> tuple[Line, ...]:
+    """
+    Keep only the lines that are the strict maximum somewhere on [0, 1].
+    """
+    hull: list[Line] = []
+    for line in sorted(set(lines)):
+        if hull and hull[-1][0] == line[0]:
+            hull.pop()
+        while len(hull) >= 2 and _intersection(hull[-2], line) <= _intersection(hull[-2], hull[-1]):
+            hull.pop()
+        hull.append(line)
+
+    breaks = [_intersection(hull[i], hull[i + 1]) for i in range(len(hull) - 1)]
+    starts = [_ZERO] + [max(x, _ZERO) for x in breaks]
+    ends = [min(x, _ONE) for x in breaks] + [_ONE]
+    return tuple(
+        line for line, start, end in zip(hull, starts, ends)
+        if start < end
+    )
+
+
+def _evaluate(envelope: tuple[Line, ...], p: Fraction) -> Fraction:
+    return max(slope * p + intercept for slope, intercept in envelope)
+
+
+def _switch_probability(closed_doors: int, p: Fraction) -> Fraction:
+    return (1 - p) / (closed_doors - 1)
+
+
+# Value envelopes of the decision made with `closed_doors` closed doors, indexed
+# by `closed_doors`. A level does not depend on the total door count, so levels
+# are shared between every call to `solve` and only grown when needed.
+# The last decision ends the game: staying wins with p, switching with 1 - p.
+_decision_values: list[tuple[Line, ...]] = [(), (), ((_ONE * -1, _ONE), (_ONE, _ZERO))]
+
+
+def _grow_decision_values(closed_doors: int) -> None:
+    for level in range(len(_decision_values), closed_doors + 1):
+        # After the agent acts the host opens a door, which leaves p unchanged.
+        next_values = _decision_values[level - 1]
+        switched = [
+            (-slope / (level - 1), slope / (level - 1) + intercept)
+            for slope, intercept in next_values
+        ]
+        _decision_values.append(_upper_envelope(list(next_values) + switched))
+
+
+@lru_cache(maxsize=None)
+def solve(door_count: int) -> Solution:
+    """
+    Return the optimal stay/switch policy and its exact win probability.
+
+    The policy maps the number of closed doors at each decision to the action
+    to take. The first pick is irrelevant by symmetry and is not included.
+    """
+    if door_count < 2:
+        raise ValueError("Need at least two doors")
+    p = Fraction(1, door_count)
+    if door_count == 2:
+        return Solution(door_count=door_count, value=p, policy={})
+
+    _grow_decision_values(door_count - 2)
+    policy: dict[int, Action] = {}
+    for closed_doors in range(door_count - 1, 1, -1):
+        switched = _switch_probability(closed_doors, p)
+        if closed_doors == 2:
+            stay_value, switch_value = p, switched
+        else:
+            stay_value = _evaluate(_decision_values[closed_doors - 1], p)
+            switch_value = _evaluate(_decision_values[closed_doors - 1], switched)
+        if switch_value > stay_value:
+            policy[closed_doors] = Action.SWITCH
+            p = switched
+        else:
+            policy[closed_doors] = Action.STAY
+    return Solution(door_count=door_count, value=p, policy=policy)
+
+
+class OptimalPolicy(BaseAgent):
+    """
+    Plays the policy returned by `solve` for the door count it is shown.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.solution: Solution | None = None
+
+    def act(self, observation: State) -> ActionSetup:
+        if not observation.selected_door:
+            door_count = len(observation.available_doors)
+            if not self.solution or self.solution.door_count != door_count:
+                self.solution = solve(door_count)
+            return ActionSetup(
+                action_name=Action.CHOOSE,
+                arguments=[0],
+                keyword_arguments={},
+            )
+        if not self.solution:
+            raise ValueError("No solution to act on.")
+        action = self.solution.policy[len(observation.available_doors)]
+        return ActionSetup(
+            action_name=action,
+            arguments=[],
+            keyword_arguments={},
+        )
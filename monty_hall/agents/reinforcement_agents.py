@@ -1,8 +1,16 @@
+from abc import abstractmethod
 from collections import defaultdict
+from collections.abc import Hashable
 import random
+import numpy as np
 from monty_hall.agents.base import BaseAgent, Action, ActionSetup
+from monty_hall.agents.convergence import ConvergenceMonitor
+from monty_hall.agents.featurizers import Featurizer, door_counts, full_state
+from monty_hall.agents.replay import ReplayBuffer, batch_update
 from monty_hall.env.monty import State, StepResult, Result
 
+_ACTION_COLUMNS: dict[Action, int] = {action: column for column, action in enumerate(Action)}
+
 def _select_random_door(observation: State) -> ActionSetup:
     return ActionSetup(
                 action_name=Action.CHOOSE,
@@ -24,21 +32,60 @@ def _stay_door(observation: State) -> ActionSetup:
         keyword_arguments={},
     )
 
-class RLItsProbablyFine(BaseAgent):
-    def __init__(self) -> None:
+class BaseQAgent(BaseAgent):
+    """
+    Epsilon-greedy play, freezing and convergence tracking for tabular
+    Q-learners. Subclasses decide how Q-values are stored and updated.
+    """
+    def __init__(self, featurizer: Featurizer = full_state, alpha: float = 0.1, epsilon: float = 0.1, convergence: ConvergenceMonitor | None = None) -> None:
         super().__init__()
-        self._q_table: defaultdict[State, defaultdict[str, float]] = defaultdict(
-            lambda: defaultdict(float)
-        )
         self.actions = [Action.CHOOSE, Action.STAY, Action.SWITCH]
-        self.alpha = 0.1
-        self.epsilon = 0.1
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.featurizer = featurizer
+        self.has_switched = False
         self.last_observation: State | None = None
+        self.last_features: Hashable | None = None
+        self.convergence = convergence
+        self.games_played = 0
+        # Once converged the agent stops learning and plays greedily. Results
+        # from `frozen_at` onwards are pure evaluation.
+        self.frozen = False
+        self.frozen_at: int | None = None
+        self._frozen_policy: dict[Hashable, Action] = {}
+
+    def reset(self) -> None:
+        self.has_switched = False
+
+    @abstractmethod
+    def _greedy_action(self, features: Hashable) -> Action:
+        ...
+
+    @abstractmethod
+    def _update(self, features: Hashable, action: Action, reward: float) -> tuple[float, float]:
+        """
+        Learn from one step and return the Q-value of (features, action) before and after.
+        """
+        ...
+
+    def freeze(self) -> None:
+        """
+        Stop exploring and updating the Q-table.
+        """
+        self.frozen = True
+        self.frozen_at = self.games_played
+        self.epsilon = 0.0
 
     def act(self, observation: State) -> ActionSetup:
         self.last_observation = observation
+        self.last_features = self.featurizer(observation, self.has_switched)
         if not observation.selected_door:
             return _select_random_door(observation)
+        if self.frozen:
+            action = self._frozen_policy.get(self.last_features)
+            if action is None:
+                action = self._frozen_policy[self.last_features] = self._greedy_action(self.last_features)
+            return _switch_door(observation) if action == Action.SWITCH else _stay_door(observation)
         if random.random() < self.epsilon:
             action = random.choice([Action.STAY, Action.SWITCH])
             return ActionSetup(
@@ -46,38 +93,134 @@ class RLItsProbablyFine(BaseAgent):
                 arguments=[],
                 keyword_arguments={},
             )
-        should_move = self._q_table[self.last_observation][Action.SWITCH.value]
-        should_stay = self._q_table[self.last_observation][Action.STAY.value]
-        if should_move > should_stay:
+        if self._greedy_action(self.last_features) == Action.SWITCH:
             return _switch_door(observation)
         return _stay_door(observation)
 
     def observe_step(self, step_result: StepResult) -> None:
+        action = step_result.action
+        if action == Action.SWITCH:
+            self.has_switched = True
+        if self.frozen:
+            return
         if not self.last_observation:
             raise ValueError("No last observation to update Q-table with.")
-        action = step_result.action
-        score_delta = step_result.score_delta
-        old_score = self._q_table[self.last_observation][action.value]
-        new_score = old_score + self.alpha * (score_delta - old_score)
-        self._q_table[self.last_observation][action.value] = new_score
+        greedy_before = self._greedy_action(self.last_features) if self.convergence else None
+        old_score, new_score = self._update(self.last_features, action, step_result.score_delta)
+        if self.convergence:
+            policy_changed = greedy_before != self._greedy_action(self.last_features)
+            self.convergence.observe_update(old_score, new_score, policy_changed)
+
+    def observe_result(self, result: Result) -> None:
+        self.games_played += 1
+        if self.convergence and not self.frozen and self.convergence.end_game():
+            self.freeze()
+
+
+class RLItsProbablyFine(BaseQAgent):
+    def __init__(self, featurizer: Featurizer = full_state, alpha: float = 0.1, epsilon: float = 0.1, convergence: ConvergenceMonitor | None = None) -> None:
+        super().__init__(featurizer=featurizer, alpha=alpha, epsilon=epsilon, convergence=convergence)
+        self._q_table: defaultdict[Hashable, defaultdict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    def _greedy_action(self, features: Hashable) -> Action:
+        should_move = self._q_table[features][Action.SWITCH.value]
+        should_stay = self._q_table[features][Action.STAY.value]
+        if should_move > should_stay:
+            return Action.SWITCH
+        return Action.STAY
+
+    def _update(self, features: Hashable, action: Action, reward: float) -> tuple[float, float]:
+        old_score = self._q_table[features][action.value]
+        new_score = old_score + self.alpha * (reward - old_score)
+        self._q_table[features][action.value] = new_score
+        return old_score, new_score
 
 
 class RLItsProbablyFineDecayingEpsilon(RLItsProbablyFine):
-    def __init__(self, initial_epsilon: float = 0.2, decay_rate: float = 0.99) -> None:
-        super().__init__()
-        self.epsilon = initial_epsilon
+    def __init__(self, initial_epsilon: float = 0.2, decay_rate: float = 0.999, featurizer: Featurizer = full_state, alpha: float = 0.1, min_epsilon: float = 0.01, convergence: ConvergenceMonitor | None = None) -> None:
+        super().__init__(featurizer=featurizer, alpha=alpha, epsilon=initial_epsilon, convergence=convergence)
         self.initial_epsilon = initial_epsilon
-        self.min_epsilon = 0.01
+        self.min_epsilon = min_epsilon
         self.episode = 0
-        self.decay_rate = 0.999
+        self.decay_rate = decay_rate
         self.episode_count = 0
 
     def observe_result(self, result: Result) -> None:
         super().observe_result(result)
+        if self.frozen:
+            return
         self.episode_count += 1
         self.epsilon = max(self.min_epsilon, self.initial_epsilon * (self.decay_rate ** self.episode_count))
 
 
+class RLDoorCounts(RLItsProbablyFine):
+    """
+    Keys the Q-table on how many doors are closed and open, so it stays
+    O(door_count) in size and learns across door identities.
+    """
+    def __init__(self) -> None:
+        super().__init__(featurizer=door_counts)
+
+
+class RLDoorCountsDecayingEpsilon(RLItsProbablyFineDecayingEpsilon):
+    def __init__(self, initial_epsilon: float = 0.2, decay_rate: float = 0.999) -> None:
+        super().__init__(initial_epsilon=initial_epsilon, decay_rate=decay_rate, featurizer=door_counts)
+
+
+class RLDoorCountsConverging(RLItsProbablyFineDecayingEpsilon):
+    """
+    Stops learning once its policy has been stable for a while, so the rest
+    of a run measures the learned policy instead of exploration.
+    """
+    def __init__(self) -> None:
+        super().__init__(featurizer=door_counts, convergence=ConvergenceMonitor())
+
+
+class RLItsProbablyFineReplay(BaseQAgent):
+    """
+    Learns from minibatches sampled out of a replay buffer of past transitions
+    instead of only the latest one, reusing every game many times.
+    """
+    def __init__(self, featurizer: Featurizer = full_state, alpha: float = 0.1, epsilon: float = 0.1, capacity: int = 10000, batch_size: int = 32, seed: int | None = None, convergence: ConvergenceMonitor | None = None) -> None:
+        super().__init__(featurizer=featurizer, alpha=alpha, epsilon=epsilon, convergence=convergence)
+        self.replay = ReplayBuffer(capacity, seed=seed)
+        self.batch_size = batch_size
+        self.q_values = np.zeros((16, len(_ACTION_COLUMNS)), dtype=np.float64)
+        self._state_ids: dict[Hashable, int] = {}
+
+    def _state_id(self, features: Hashable) -> int:
+        state_id = self._state_ids.get(features)
+        if state_id is None:
+            state_id = self._state_ids[features] = len(self._state_ids)
+            if state_id == len(self.q_values):
+                self.q_values = np.concatenate([self.q_values, np.zeros_like(self.q_values)])
+        return state_id
+
+    def _greedy_action(self, features: Hashable) -> Action:
+        state_id = self._state_ids.get(features)
+        if state_id is None:
+            return Action.STAY
+        values = self.q_values[state_id]
+        if values[_ACTION_COLUMNS[Action.SWITCH]] > values[_ACTION_COLUMNS[Action.STAY]]:
+            return Action.SWITCH
+        return Action.STAY
+
+    def _update(self, features: Hashable, action: Action, reward: float) -> tuple[float, float]:
+        state_id = self._state_id(features)
+        column = _ACTION_COLUMNS[action]
+        old_score = float(self.q_values[state_id, column])
+        self.replay.add(state_id, column, reward)
+        batch_update(self.q_values, *self.replay.sample(self.batch_size), alpha=self.alpha)
+        return old_score, float(self.q_values[state_id, column])
+
+
+class RLDoorCountsReplay(RLItsProbablyFineReplay):
+    def __init__(self) -> None:
+        super().__init__(featurizer=door_counts)
+
+
 # class RLMyFavoriteDoor(BaseAgent):
 #     def __init__(self) -> None:
 #         super().__init__()
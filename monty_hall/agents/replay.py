@@ -0,0 +1,51 @@
+"""
+Fixed-capacity experience replay for tabular agents.
+
+Transitions are stored as integer state ids, action columns and rewards in
+preallocated NumPy arrays used as a ring buffer, so adding one never allocates
+and old transitions are overwritten once the buffer is full. Agents sample
+minibatches and apply `batch_update` to a NumPy Q array in one vectorized step.
+"""
+import numpy as np
+
+
+class ReplayBuffer:
+    def __init__(self, capacity: int, seed: int | None = None):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.states = np.zeros(capacity, dtype=np.int64)
+        self.actions = np.zeros(capacity, dtype=np.int8)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, state: int, action: int, reward: float) -> None:
+        self.states[self._next] = state
+        self.actions[self._next] = action
+        self.rewards[self._next] = reward
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def sample(self, batch_size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if not self._size:
+            raise ValueError("Cannot sample from an empty buffer")
+        picks = self.rng.integers(0, self._size, size=batch_size)
+        return self.states[picks], self.actions[picks], self.rewards[picks]
+
+
+def batch_update(q_values: np.ndarray, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray, alpha: float) -> None:
+    """
+    Move each sampled Q-value towards the mean reward it was sampled with.
+    Repeated (state, action) pairs in a batch count once, so a batch never
+    moves a value further than a single update with `alpha` would.
+    """
+    errors = np.zeros_like(q_values)
+    counts = np.zeros_like(q_values)
+    np.add.at(errors, (states, actions), rewards - q_values[states, actions])
+    np.add.at(counts, (states, actions), 1)
+    q_values += alpha * errors / np.maximum(counts, 1)
@@ -0,0 +1,164 @@
+"""
+Hogwild-style parallel training for `RLItsProbablyFine`.
+
+The Q-table lives in a NumPy array in `multiprocessing.shared_memory`, so
+several worker processes can each play their own `Monty` games and update the
+same table. Updates are lock-free by default; with `lock_stripes` each update
+takes one of a few locks picked by the number of closed doors. Once the
+workers finish, the table is copied back into a normal agent.
+
+The array needs a fixed layout, so only the count based featurizers are
+supported: rows are the number of closed doors and whether the agent switched.
+"""
+from collections.abc import Hashable, Iterator
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Lock
+import random
+import numpy as np
+from monty_hall.agents.featurizers import Featurizer, door_counts, door_counts_and_switched
+from monty_hall.agents.reinforcement_agents import RLItsProbablyFine
+from monty_hall.env.monty import Action, Monty, StepResult
+from monty_hall.main import repeat_simulation
+
+ACTION_COLUMNS: dict[str, int] = {action.value: column for column, action in enumerate(Action)}
+
+_SHARED_FEATURIZERS = (door_counts, door_counts_and_switched)
+
+
+def _row(features: Hashable) -> tuple[int, int]:
+    closed, _, *switched = features  # type: ignore
+    return closed, int(bool(switched and switched[0]))
+
+
+class SharedQRow:
+    """
+    The Q-values of one featurized state, indexed by action value like the
+    inner dicts of `RLItsProbablyFine._q_table`.
+    """
+    def __init__(self, values: np.ndarray):
+        self._values = values
+
+    def __getitem__(self, action: str) -> float:
+        return float(self._values[ACTION_COLUMNS[action]])
+
+    def __setitem__(self, action: str, value: float) -> None:
+        self._values[ACTION_COLUMNS[action]] = value
+
+
+class SharedQTable:
+    def __init__(self, door_count: int, name: str | None = None):
+        self.door_count = door_count
+        shape = (door_count + 1, 2, len(ACTION_COLUMNS))
+        size = int(np.prod(shape)) * np.dtype(np.float64).itemsize
+        self._owner = name is None
+        self._memory = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+        self.values: np.ndarray = np.ndarray(shape, dtype=np.float64, buffer=self._memory.buf)
+        if self._owner:
+            self.values[:] = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __getitem__(self, features: Hashable) -> SharedQRow:
+        closed, switched = _row(features)
+        return SharedQRow(self.values[closed, switched])
+
+    def items(self, featurizer: Featurizer) -> Iterator[tuple[Hashable, dict[str, float]]]:
+        """
+        The table as (features, action values) pairs keyed the way `featurizer` keys them.
+        """
+        for closed in range(self.door_count + 1):
+            for switched in (False, True):
+                if featurizer is door_counts:
+                    if switched:
+                        continue
+                    features: Hashable = (closed, self.door_count - closed)
+                else:
+                    features = (closed, self.door_count - closed, switched)
+                yield features, {
+                    action: float(self.values[closed, int(switched), column])
+                    for action, column in ACTION_COLUMNS.items()
+                }
+
+    def load_into(self, agent: RLItsProbablyFine) -> None:
+        for features, action_values in self.items(agent.featurizer):
+            for action, value in action_values.items():
+                if value:
+                    agent._q_table[features][action] = value
+
+    def close(self) -> None:
+        # Views into the buffer have to go before the memory can be closed.
+        del self.values
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+class SharedQAgent(RLItsProbablyFine):
+    """
+    `RLItsProbablyFine` reading and writing a `SharedQTable` instead of its own dicts.
+    """
+    def __init__(self, table: SharedQTable, featurizer: Featurizer = door_counts, alpha: float = 0.1, epsilon: float = 0.1, locks: list[Lock] | None = None) -> None:
+        if featurizer not in _SHARED_FEATURIZERS:
+            raise ValueError("Shared Q-tables need a count based featurizer")
+        super().__init__(featurizer=featurizer, alpha=alpha, epsilon=epsilon)
+        self._q_table = table  # type: ignore
+        self.locks = locks or []
+
+    def observe_step(self, step_result: StepResult) -> None:
+        if not self.locks or self.last_features is None:
+            return super().observe_step(step_result)
+        closed, _ = _row(self.last_features)
+        with self.locks[closed % len(self.locks)]:
+            super().observe_step(step_result)
+
+
+def _train_worker(name: str, door_count: int, games: int, seed: int, featurizer: Featurizer, alpha: float, epsilon: float, locks: list[Lock]) -> None:
+    table = SharedQTable(door_count, name=name)
+    try:
+        random.seed(seed)
+        agent = SharedQAgent(table, featurizer=featurizer, alpha=alpha, epsilon=epsilon, locks=locks)
+        repeat_simulation(Monty(door_count=door_count, rng=random.Random(seed)), agent, games)
+        del agent
+    finally:
+        table.close()
+
+
+def train_hogwild(
+    door_count: int,
+    games_per_worker: int,
+    workers: int,
+    featurizer: Featurizer = door_counts,
+    alpha: float = 0.1,
+    epsilon: float = 0.1,
+    lock_stripes: int = 0,
+    seed: int = 0,
+) -> RLItsProbablyFine:
+    """
+    Train one Q-table with `workers` processes and return it loaded into a normal agent.
+    """
+    if featurizer not in _SHARED_FEATURIZERS:
+        raise ValueError("Shared Q-tables need a count based featurizer")
+    locks = [multiprocessing.Lock() for _ in range(lock_stripes)]
+    table = SharedQTable(door_count)
+    try:
+        processes = [
+            multiprocessing.Process(
+                target=_train_worker,
+                args=(table.name, door_count, games_per_worker, seed + worker, featurizer, alpha, epsilon, locks),
+            )
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        if any(process.exitcode for process in processes):
+            raise RuntimeError("Training worker failed")
+        agent = RLItsProbablyFine(featurizer=featurizer, alpha=alpha, epsilon=epsilon)
+        table.load_into(agent)
+    finally:
+        table.close()
+    return agent
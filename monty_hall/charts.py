@@ -0,0 +1,124 @@
+"""
+Headless chart rendering for simulation sweeps.
+
+Charts are described as plain data (`Chart` and `Series`) and drawn onto a
+single reused `Figure` with the Agg canvas, without pyplot, so nothing ever
+opens a window or blocks. `render_charts` draws a whole sweep in one pass and
+can spread the charts over a process pool, each worker reusing its own figure.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import os
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from monty_hall.env.monty import Result
+
+
+@dataclass(frozen=True)
+class Series:
+    label: str
+    x: list[float]
+    wins: list[int]
+    games: list[int]
+
+
+@dataclass(frozen=True)
+class Chart:
+    filename: str
+    title: str
+    xlabel: str
+    series: list[Series]
+
+
+def learning_curve(label: str, results: list[Result], window: int = 100) -> Series:
+    """
+    Win counts over consecutive blocks of `window` games.
+    """
+    won = np.fromiter((result.won for result in results), dtype=np.int64, count=len(results))
+    blocks = len(won) // window
+    wins = won[:blocks * window].reshape(blocks, window).sum(axis=1)
+    return Series(
+        label=label,
+        x=[float(window * (block + 1)) for block in range(blocks)],
+        wins=wins.tolist(),
+        games=[window] * blocks,
+    )
+
+
+def sweep_charts(results: dict[int, dict[str, list[Result]]], window: int = 100) -> list[Chart]:
+    """
+    Every chart for a sweep keyed by door count and then agent name: one
+    learning curve per agent and door count, plus win rate against door count.
+    """
+    charts: list[Chart] = []
+    by_agent: dict[str, Series] = {}
+    for door_count, agent_results in sorted(results.items()):
+        for agent_name, agent_games in agent_results.items():
+            charts.append(Chart(
+                filename=f"learning_curve_{agent_name}_{door_count}_doors.png",
+                title=f"{agent_name} - {door_count} doors",
+                xlabel="Games",
+                series=[learning_curve(agent_name, agent_games, window)],
+            ))
+            series = by_agent.setdefault(agent_name, Series(label=agent_name, x=[], wins=[], games=[]))
+            series.x.append(float(door_count))
+            series.wins.append(sum(1 for result in agent_games if result.won))
+            series.games.append(len(agent_games))
+    charts.append(Chart(
+        filename="win_rate_by_door_count.png",
+        title="Win Rate by Door Count",
+        xlabel="Doors",
+        series=list(by_agent.values()),
+    ))
+    return charts
+
+
+def _draw(figure: Figure, chart: Chart, output_dir: str) -> str:
+    figure.clear()
+    axes = figure.add_subplot()
+    for series in chart.series:
+        games = np.maximum(np.asarray(series.games, dtype=float), 1)
+        rate = np.asarray(series.wins) / games
+        # 95% normal-approximation confidence band
+        band = 1.96 * np.sqrt(rate * (1 - rate) / games)
+        axes.plot(series.x, rate * 100, marker=".", label=series.label)
+        axes.fill_between(series.x, (rate - band) * 100, (rate + band) * 100, alpha=0.2)
+    axes.set_title(chart.title)
+    axes.set_xlabel(chart.xlabel)
+    axes.set_ylabel("Win Rate (%)")
+    axes.set_ylim(0, 100)
+    axes.legend(loc="lower right")
+    path = os.path.join(output_dir, chart.filename)
+    figure.savefig(path)
+    return path
+
+
+def _new_figure() -> Figure:
+    figure = Figure(figsize=(8, 5))
+    FigureCanvasAgg(figure)
+    return figure
+
+
+_worker_figure: Figure | None = None
+
+
+def _render_in_worker(chart: Chart, output_dir: str) -> str:
+    global _worker_figure
+    if _worker_figure is None:
+        _worker_figure = _new_figure()
+    return _draw(_worker_figure, chart, output_dir)
+
+
+def render_charts(charts: list[Chart], output_dir: str, workers: int | None = None) -> list[str]:
+    """
+    Render every chart into `output_dir` and return the file paths. With
+    `workers` the charts are split across that many processes.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if not workers:
+        figure = _new_figure()
+        return [_draw(figure, chart, output_dir) for chart in charts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(charts) // (workers * 4))
+        return list(executor.map(_render_in_worker, charts, [output_dir] * len(charts), chunksize=chunksize))
@@ -0,0 +1,152 @@
+"""
+Host strategies for `Monty` and `VectorMonty`.
+
+Every host has a scalar `choose_door`, used by `Monty` one game at a time, and
+a batched `choose_doors` that picks a door for many games at once from NumPy
+arrays, used by `VectorMonty`. Both only pick the door; the environments still
+enforce when the host may act and do the opening.
+"""
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import random
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from monty_hall.env.monty import Door
+
+
+def random_doors(candidates: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Pick one door uniformly from each row of a (games, doors) candidate mask.
+    """
+    scores = rng.random(candidates.shape)
+    scores[~candidates] = -1
+    return scores.argmax(axis=1)
+
+
+def _closed_unselected(open_doors: np.ndarray, selected_door: np.ndarray) -> np.ndarray:
+    candidates = ~open_doors
+    candidates[np.arange(len(candidates)), selected_door] = False
+    return candidates
+
+
+class BaseHost(ABC):
+    @abstractmethod
+    def choose_door(self, doors: list[Door], selected_door: Door, winning_door: Door, rng: random.Random) -> Door:
+        ...
+
+    @abstractmethod
+    def choose_doors(
+        self,
+        open_doors: np.ndarray,
+        selected_door: np.ndarray,
+        winning_door: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        ...
+
+
+class ClassicHost(BaseHost):
+    """
+    Never opens the selected or the winning door, choosing uniformly among the rest.
+    """
+    def choose_door(self, doors: list[Door], selected_door: Door, winning_door: Door, rng: random.Random) -> Door:
+        selectable_doors = [
+            door for door in doors
+            if door != selected_door and not door.is_open and door != winning_door
+        ]
+        return rng.choice(selectable_doors)
+
+    def choose_doors(
+        self,
+        open_doors: np.ndarray,
+        selected_door: np.ndarray,
+        winning_door: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        candidates = _closed_unselected(open_doors, selected_door)
+        candidates[np.arange(len(candidates)), winning_door] = False
+        return random_doors(candidates, rng)
+
+
+class IgnorantHost(BaseHost):
+    """
+    Doesn't know where the prize is, so may open the winning door.
+    """
+    def choose_door(self, doors: list[Door], selected_door: Door, winning_door: Door, rng: random.Random) -> Door:
+        selectable_doors = [
+            door for door in doors
+            if door != selected_door and not door.is_open
+        ]
+        return rng.choice(selectable_doors)
+
+    def choose_doors(
+        self,
+        open_doors: np.ndarray,
+        selected_door: np.ndarray,
+        winning_door: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        return random_doors(_closed_unselected(open_doors, selected_door), rng)
+
+
+class RandomHost(BaseHost):
+    """
+    Acts like an `IgnorantHost` with probability `ignorant_rate`, otherwise like a `ClassicHost`.
+    """
+    def __init__(self, ignorant_rate: float = 0.5):
+        self.ignorant_rate = ignorant_rate
+        self._classic = ClassicHost()
+        self._ignorant = IgnorantHost()
+
+    def choose_door(self, doors: list[Door], selected_door: Door, winning_door: Door, rng: random.Random) -> Door:
+        if rng.random() < self.ignorant_rate:
+            return self._ignorant.choose_door(doors, selected_door, winning_door, rng)
+        return self._classic.choose_door(doors, selected_door, winning_door, rng)
+
+    def choose_doors(
+        self,
+        open_doors: np.ndarray,
+        selected_door: np.ndarray,
+        winning_door: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        ignorant = rng.random(len(selected_door)) < self.ignorant_rate
+        return np.where(
+            ignorant,
+            self._ignorant.choose_doors(open_doors, selected_door, winning_door, rng),
+            self._classic.choose_doors(open_doors, selected_door, winning_door, rng),
+        )
+
+
+class DecoyHost(BaseHost):
+    """
+    Lies to players holding a losing door: while the winning door is still
+    closed, with probability `lie_rate` it opens it as if it were a goat, so
+    switching can no longer win. Otherwise it acts like a `ClassicHost`.
+    """
+    def __init__(self, lie_rate: float = 0.5):
+        self.lie_rate = lie_rate
+        self._classic = ClassicHost()
+
+    def choose_door(self, doors: list[Door], selected_door: Door, winning_door: Door, rng: random.Random) -> Door:
+        can_lie = selected_door != winning_door and not winning_door.is_open
+        if can_lie and rng.random() < self.lie_rate:
+            return winning_door
+        return self._classic.choose_door(doors, selected_door, winning_door, rng)
+
+    def choose_doors(
+        self,
+        open_doors: np.ndarray,
+        selected_door: np.ndarray,
+        winning_door: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        can_lie = (selected_door != winning_door) & ~open_doors[np.arange(len(open_doors)), winning_door]
+        lying = can_lie & (rng.random(len(selected_door)) < self.lie_rate)
+        return np.where(
+            lying,
+            winning_door,
+            self._classic.choose_doors(open_doors, selected_door, winning_door, rng),
+        )
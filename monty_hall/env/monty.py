@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
 import random
+from monty_hall.env.hosts import BaseHost, ClassicHost
 
 
 class ActionType(Enum):
@@ -8,7 +9,7 @@ class ActionType(Enum):
     HOST_ACTION = "host_action"
 
 
-@dataclass
+@dataclass(slots=True)
 class Door:
     index: int
     is_open: bool = False
@@ -16,7 +17,7 @@ class Door:
     def __hash__(self):
         return f"{self.index}_{self.is_open}".__hash__()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     available_doors: tuple[Door,...]
     selected_door: Door | None
@@ -27,23 +28,32 @@ class Action(Enum):
     SWITCH = "switch"
     CHOOSE = "select"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StepResult:
     action: Action
     score_delta: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     won: bool
     score: int = 0
 
 
+_STEP_RESULTS = {
+    (action, delta): StepResult(action=action, score_delta=delta)
+    for action in Action
+    for delta in (0, 100)
+}
+
+
 class Monty:
-    def __init__(self, door_count: int=3, rng: random.Random | None=None):
+    def __init__(self, door_count: int=3, rng: random.Random | None=None, host: BaseHost | None=None):
         self.door_count = door_count
         self.rng = rng or random.Random()
+        self.host = host or ClassicHost()
         self.selected_door: Door | None = None
+        self.doors: list[Door] = []
         self.reset()
 
     def _set_winning_door(self):
@@ -53,18 +63,23 @@ class Monty:
     def reset(self):
         self.winning_door = None
         self.selected_door = None
-        self.doors: list[Door] =[
-            Door(index=i) for i in range(self.door_count)
-        ]
+        if len(self.doors) == self.door_count:
+            for door in self.doors:
+                door.is_open = False
+        else:
+            self.doors = [Door(index=i) for i in range(self.door_count)]
+            # States hand out these snapshots instead of the live doors, so an
+            # observation never changes under an agent when doors are reused.
+            self._snapshots = (
+                tuple(Door(index=i) for i in range(self.door_count)),
+                tuple(Door(index=i, is_open=True) for i in range(self.door_count)),
+            )
         self._set_winning_door()
         self.last_action: ActionType | None = None
 
     def _build_step_result(self, action: Action) -> StepResult:
         delta = 100 if self.done() and self.has_won() else 0
-        return StepResult(
-            action=action,
-            score_delta=delta
-        )
+        return _STEP_RESULTS[action, delta]
 
     def select_door(self, door_index: int) -> StepResult:
         if door_index < 0 or door_index >= self.door_count:
@@ -77,7 +92,7 @@ class Monty:
         self.last_action = ActionType.USER_ACTION
         return self._build_step_result(Action.CHOOSE)
 
-    def host_opens_door(self):
+    def host_opens_door(self) -> Door:
         if not self.selected_door:
             raise ValueError("No door selected")
         if self.last_action != ActionType.USER_ACTION:
@@ -88,13 +103,10 @@ class Monty:
         ]
         if len(unopened_doors) <= 2:
             raise ValueError("Cannot open a door when only two unopened doors remain")
-        selectable_doors = [
-            door for door in self.doors
-            if door != self.selected_door and not door.is_open and door != self.winning_door
-        ]
-        door_to_open = self.rng.choice(selectable_doors)
+        door_to_open = self.host.choose_door(self.doors, self.selected_door, self.winning_door, self.rng)
         door_to_open.is_open = True
         self.last_action = ActionType.HOST_ACTION
+        return door_to_open
 
     def has_won(self) -> bool:
         if not self.selected_door:
@@ -132,17 +144,21 @@ class Monty:
         self.last_action = ActionType.USER_ACTION
         return self._build_step_result(Action.STAY)
 
+    def _snapshot(self, door: Door) -> Door:
+        return self._snapshots[door.is_open][door.index]
+
     def get_state(self) -> State:
-        available_doors = [
-            door for door in self.doors if not door.is_open
-        ]
-        open_doors = [
-            door for door in self.doors if door.is_open
-        ]
+        closed, opened = self._snapshots
+        available_doors = tuple([
+            closed[door.index] for door in self.doors if not door.is_open
+        ])
+        open_doors = tuple([
+            opened[door.index] for door in self.doors if door.is_open
+        ])
         return State(
-            available_doors=tuple(available_doors),
-            selected_door=self.selected_door,
-            open_doors=tuple(open_doors)
+            available_doors=available_doors,
+            selected_door=self._snapshot(self.selected_door) if self.selected_door else None,
+            open_doors=open_doors
         )
 
     def get_result(self) -> Result:
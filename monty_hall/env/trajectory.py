@@ -0,0 +1,129 @@
+"""
+Fixed-width binary log of everything that happens inside a game.
+
+Each event is one little-endian record matching `TRAJECTORY_DTYPE`, so a log
+written by `TrajectoryRecorder` can be memory-mapped by `load_trajectory` as a
+NumPy structured array without parsing. The recorder takes one call per game
+that only extends a few lists; the records themselves are built with NumPy
+and written in one go whenever a chunk fills.
+"""
+from enum import IntEnum
+from types import TracebackType
+import numpy as np
+from monty_hall.env.monty import Action, Result, StepResult
+
+
+class Event(IntEnum):
+    AGENT_ACTION = 0
+    HOST_REVEAL = 1
+    RESULT = 2
+
+
+# `door` is the selected door for agent actions, the opened door for host
+# reveals and the winning door for results. `won` is only set on results.
+TRAJECTORY_DTYPE = np.dtype([
+    ("game", "<u4"),
+    ("step", "<u4"),
+    ("event", "u1"),
+    ("action", "u1"),
+    ("door", "<i4"),
+    ("score_delta", "<i2"),
+    ("won", "u1"),
+])
+
+ACTION_CODES: dict[Action, int] = {action: code for code, action in enumerate(Action)}
+NO_ACTION = 255
+
+
+class TrajectoryRecorder:
+    def __init__(self, path: str, chunk_size: int = 65536):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        self.path = path
+        self.game = 0
+        self._chunk_size = chunk_size
+        self._buffered = 0
+        self._lengths: list[int] = []
+        self._doors: list[int] = []
+        self._actions: list[Action] = []
+        self._deltas: list[int] = []
+        self._scores: list[int] = []
+        self._won: list[bool] = []
+        self._file = open(path, "wb")
+
+    def record_game(self, step_results: list[StepResult], doors: list[int], result: Result, winning_door_index: int) -> None:
+        """
+        Log one finished game. `doors` alternates between the door the agent
+        had selected after each of its actions and the door the host opened
+        next, so it starts and ends with an agent action.
+        """
+        if len(doors) != 2 * len(step_results) - 1:
+            raise ValueError("Every host reveal must sit between two agent actions")
+        self._lengths.append(len(doors) + 1)
+        self._doors.extend(doors)
+        self._doors.append(winning_door_index)
+        self._actions.extend([step_result.action for step_result in step_results])
+        self._deltas.extend([step_result.score_delta for step_result in step_results])
+        self._scores.append(result.score)
+        self._won.append(result.won)
+        self._buffered += len(doors) + 1
+        if self._buffered >= self._chunk_size:
+            self.flush()
+
+    def _records(self) -> np.ndarray:
+        lengths = np.asarray(self._lengths, dtype=np.int64)
+        records = np.zeros(self._buffered, dtype=TRAJECTORY_DTYPE)
+        starts = np.cumsum(lengths) - lengths
+        step = np.arange(self._buffered) - np.repeat(starts, lengths)
+        is_result = step == np.repeat(lengths - 1, lengths)
+        event = np.where(is_result, Event.RESULT, step % 2)
+        is_action = event == Event.AGENT_ACTION
+        records["game"] = np.repeat(np.arange(self.game, self.game + len(lengths)), lengths)
+        records["step"] = step
+        records["event"] = event
+        records["action"] = NO_ACTION
+        records["action"][is_action] = [ACTION_CODES[action] for action in self._actions]
+        records["door"] = self._doors
+        records["score_delta"][is_action] = self._deltas
+        records["score_delta"][is_result] = self._scores
+        records["won"][is_result] = self._won
+        return records
+
+    def flush(self) -> None:
+        if self._buffered:
+            self._file.write(self._records().tobytes())
+            self.game += len(self._lengths)
+        self._file.flush()
+        self._buffered = 0
+        for buffer in (self._lengths, self._doors, self._actions, self._deltas, self._scores, self._won):
+            buffer.clear()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "TrajectoryRecorder":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def load_trajectory(path: str) -> np.ndarray:
+    """
+    Memory-map a log written by `TrajectoryRecorder` as a structured array.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+    if size % TRAJECTORY_DTYPE.itemsize:
+        raise ValueError("Trajectory file is truncated")
+    if size == 0:
+        return np.zeros(0, dtype=TRAJECTORY_DTYPE)
+    return np.memmap(path, dtype=TRAJECTORY_DTYPE, mode="r")
@@ -0,0 +1,113 @@
+"""
+Vectorized, Gym-style version of `Monty` for batch learners.
+
+`VectorMonty` plays `num_envs` games side by side with Monty's rules, holding
+every game in NumPy arrays. Actions are integers: `0..door_count - 1` selects
+that door, `stay_action` stands and `switch_action` switches to a random other
+closed door. After every agent action the host opens a door automatically,
+until two doors are left and the game ends. Finished games are reset in place,
+so the observation returned by `step` is always the next decision.
+"""
+import numpy as np
+from monty_hall.env.hosts import BaseHost, ClassicHost, random_doors
+
+DOOR_CLOSED = 0
+DOOR_OPEN = 1
+DOOR_SELECTED = 2
+
+WIN_SCORE = 100
+
+
+class VectorMonty:
+    def __init__(self, num_envs: int, door_count: int = 3, seed: int | None = None, host: BaseHost | None = None):
+        if num_envs < 1:
+            raise ValueError("Need at least one game")
+        if door_count < 2:
+            raise ValueError("Need at least two doors")
+        self.num_envs = num_envs
+        self.door_count = door_count
+        self.stay_action = door_count
+        self.switch_action = door_count + 1
+        self.action_count = door_count + 2
+        self.rng = np.random.default_rng(seed)
+        self.host = host or ClassicHost()
+        self._games = np.arange(num_envs)
+        self.winning_door = np.zeros(num_envs, dtype=np.int64)
+        self.selected_door = np.full(num_envs, -1, dtype=np.int64)
+        self.open_doors = np.zeros((num_envs, door_count), dtype=bool)
+        self.closed_count = np.full(num_envs, door_count, dtype=np.int64)
+        self.reset()
+
+    def _reset_games(self, games: np.ndarray) -> None:
+        self.winning_door[games] = self.rng.integers(0, self.door_count, size=len(games))
+        self.selected_door[games] = -1
+        self.open_doors[games] = False
+        self.closed_count[games] = self.door_count
+
+    def reset(self) -> np.ndarray:
+        self._reset_games(self._games)
+        return self.observation()
+
+    def observation(self) -> np.ndarray:
+        """
+        (num_envs, door_count) int8 array of DOOR_CLOSED, DOOR_OPEN and DOOR_SELECTED.
+        """
+        observation = self.open_doors.astype(np.int8)
+        selected = self.selected_door >= 0
+        observation[self._games[selected], self.selected_door[selected]] = DOOR_SELECTED
+        return observation
+
+    def action_mask(self) -> np.ndarray:
+        """
+        (num_envs, action_count) bool array of the actions Monty allows right now.
+        """
+        mask = np.zeros((self.num_envs, self.action_count), dtype=bool)
+        mask[:, :self.door_count] = ~self.open_doors
+        has_selection = self.selected_door >= 0
+        mask[:, self.stay_action] = has_selection
+        mask[:, self.switch_action] = has_selection
+        return mask
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """
+        Apply one action per game and return (observation, rewards, dones, info).
+
+        `info["won"]` marks the games that finished with the prize. Those games
+        have already been reset when this returns.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError("Need exactly one action per game")
+        if ((actions < 0) | (actions >= self.action_count)).any():
+            raise ValueError("Unknown action")
+        if not self.action_mask()[self._games, actions].all():
+            raise ValueError("Action not allowed in the current state")
+
+        choose = actions < self.door_count
+        self.selected_door[choose] = actions[choose]
+
+        switching = self._games[actions == self.switch_action]
+        if len(switching):
+            candidates = ~self.open_doors[switching]
+            candidates[np.arange(len(switching)), self.selected_door[switching]] = False
+            self.selected_door[switching] = random_doors(candidates, self.rng)
+
+        dones = self.closed_count <= 2
+        won = dones & (self.selected_door == self.winning_door)
+        rewards = np.where(won, WIN_SCORE, 0)
+
+        hosting = self._games[~dones]
+        if len(hosting):
+            doors_to_open = self.host.choose_doors(
+                self.open_doors[hosting],
+                self.selected_door[hosting],
+                self.winning_door[hosting],
+                self.rng,
+            )
+            self.open_doors[hosting, doors_to_open] = True
+            self.closed_count[hosting] -= 1
+
+        finished = self._games[dones]
+        if len(finished):
+            self._reset_games(finished)
+        return self.observation(), rewards, dones, {"won": won}
@@ -1,8 +1,17 @@
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
+import time
 from monty_hall.agents import non_ai_agents
 from monty_hall.agents import reinforcement_agents
+from monty_hall.agents import optimal_agents
+from monty_hall.env.hosts import BaseHost
 from monty_hall.env.monty import Monty, State, Result, StepResult
+from monty_hall.env.trajectory import TrajectoryRecorder
 from monty_hall.agents.base import BaseAgent, Action
+from monty_hall.charts import render_charts, sweep_charts
+from monty_hall.progress import ProgressCounters, ProgressDisplay
 import matplotlib.pyplot as plt
 
 def _act(env: Monty, agent: BaseAgent, observation: State) -> StepResult:
@@ -19,26 +28,63 @@ def _act(env: Monty, agent: BaseAgent, observation: State) -> StepResult:
 
 
 
-def run_simulation(env: Monty, agent: BaseAgent) -> Result:
+def run_simulation(env: Monty, agent: BaseAgent, recorder: TrajectoryRecorder | None = None) -> Result:
     env.reset()
     agent.reset()
-    _act(env, agent, env.get_state())
+    step_results: list[StepResult] = []
+    doors: list[int] = []
+    step_result = _act(env, agent, env.get_state())
+    if recorder and env.selected_door:
+        step_results.append(step_result)
+        doors.append(env.selected_door.index)
 
     while not env.done():
-        env.host_opens_door()
+        opened_door = env.host_opens_door()
         step_result = _act(env, agent, env.get_state())
+        if recorder and env.selected_door:
+            step_results.append(step_result)
+            doors.append(opened_door.index)
+            doors.append(env.selected_door.index)
         agent.observe_step(step_result)
-    result = Result(won=env.has_won())
+    result = env.get_result()
+    if recorder and env.winning_door:
+        recorder.record_game(step_results, doors, result, env.winning_door.index)
     agent.observe_result(result)
     return result
 
-def repeat_simulation(env: Monty, agent: BaseAgent, n: int):
+def repeat_simulation(env: Monty, agent: BaseAgent, n: int, recorder: TrajectoryRecorder | None = None):
     results: list[Result] = []
     for _ in range(n):
-        result = run_simulation(env, agent)
+        result = run_simulation(env, agent, recorder)
         results.append(result)
     return results
 
+def repeat_simulation_with_progress(env: Monty, agent: BaseAgent, n: int, counters: ProgressCounters, slot: int, chunk_size: int = 1000) -> list[Result]:
+    """
+    Like `repeat_simulation`, but adds to `counters` after every chunk of games
+    so a `ProgressDisplay` can follow along without touching the game loop.
+    """
+    results: list[Result] = []
+    while len(results) < n:
+        chunk = repeat_simulation(env, agent, min(chunk_size, n - len(results)))
+        counters.add(slot, len(chunk), sum(1 for result in chunk if result.won))
+        results.extend(chunk)
+    return results
+
+def repeat_simulation_until_converged(env: Monty, agent: reinforcement_agents.BaseQAgent, max_training_games: int, evaluation_games: int) -> tuple[list[Result], list[Result]]:
+    """
+    Train until the agent's convergence monitor freezes it, or for at most
+    `max_training_games`, then play `evaluation_games` with the frozen policy.
+    Returns the training and evaluation results separately.
+    """
+    training: list[Result] = []
+    while not agent.frozen and len(training) < max_training_games:
+        training.append(run_simulation(env, agent))
+    if not agent.frozen:
+        agent.freeze()
+    evaluation = repeat_simulation(env, agent, evaluation_games)
+    return training, evaluation
+
 def report_results(results: list[Result], agent_name: str) -> float:
     total = len(results)
     won = sum(1 for result in results if result.won)
@@ -46,6 +92,51 @@ def report_results(results: list[Result], agent_name: str) -> float:
     return won / total * 100
 
 
+@dataclass
+class TimedRun:
+    results: list[Result]
+    elapsed: float
+
+    @property
+    def games_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+
+def repeat_simulation_for(
+    env: Monty,
+    agent: BaseAgent,
+    seconds: float,
+    clock: Callable[[], float] = time.perf_counter,
+    chunk_seconds: float = 0.05,
+    recorder: TrajectoryRecorder | None = None,
+) -> TimedRun:
+    """
+    Play games until `seconds` of `clock` time have passed.
+
+    Pass `time.process_time` as the clock to budget CPU time instead of wall
+    time. Games are played in chunks sized from the throughput measured on the
+    previous chunk, so the clock is only read a few times per `chunk_seconds`
+    and the run overshoots the budget by at most about one chunk.
+    """
+    results: list[Result] = []
+    start = clock()
+    deadline = start + seconds
+    chunk = 1
+    now = start
+    while now < deadline:
+        results.extend(repeat_simulation(env, agent, chunk, recorder))
+        finished = clock()
+        games_per_second = chunk / max(finished - now, 1e-9)
+        chunk = max(1, int(games_per_second * min(chunk_seconds, deadline - finished)))
+        now = finished
+    return TimedRun(results=results, elapsed=now - start)
+
+
+def report_throughput(run: TimedRun, agent_name: str, door_count: int) -> float:
+    print(f"{agent_name}: Doors: {door_count}, Games: {len(run.results)}, Elapsed: {run.elapsed:.2f}s, Games/sec: {run.games_per_second:,.0f}")
+    return run.games_per_second
+
+
 def plot_results(results: dict[str, float]):
     labels = list(results.keys())
     percentages = list(results.values())
@@ -100,17 +191,63 @@ def compare_agents(env: Monty, agent_classes: list[type[BaseAgent]], total_games
     return results_summary
 
 
-def compare_accuracy_based_on_game_count(env: Monty, agent_classes: list[type[BaseAgent]], game_counts: list[int], doors: int = 3):
+def compare_agents_for_duration(env: Monty, agent_classes: list[type[BaseAgent]], seconds: float, doors: int = 3, clock: Callable[[], float] = time.perf_counter):
+    results_summary: dict[str, float] = {}
+    throughput_summary: dict[str, float] = {}
     for agent_class in agent_classes:
-        summary_accuracy_over_game_count: dict[str, float] = {}
-        for total_games in game_counts:
+        agent = agent_class()
+        run = repeat_simulation_for(env, agent, seconds, clock=clock)
+        win_rate = report_results(run.results, agent_class.__name__)
+        throughput_summary[agent_class.__name__] = report_throughput(run, agent_class.__name__, doors)
+        results_summary[agent_class.__name__] = win_rate
+
+    reset_file = True
+    write_results_md(results_summary, f"as many as fit in {seconds:g}s", reset_file=reset_file, door_count=doors)
+    return results_summary, throughput_summary
+
+
+def compare_agents_across_hosts(agent_classes: list[type[BaseAgent]], hosts: list[BaseHost], total_games: int, doors: int = 3):
+    results_summary: dict[str, dict[str, float]] = {}
+    for host in hosts:
+        host_name = type(host).__name__
+        env = Monty(door_count=doors, host=host)
+        summary_accuracy_over_agents: dict[str, float] = {}
+        for agent_class in agent_classes:
             agent = agent_class()
             results = repeat_simulation(env, agent, total_games)
-            win_rate = report_results(results, agent_class.__name__)
-            summary_accuracy_over_game_count[str(total_games)] = win_rate
-        print(f"Agent: {agent_class.__name__}")
-        reset_file = agent_class == agent_classes[0]
-        write_results_md(summary_accuracy_over_game_count, "various", reset_file=reset_file, door_count=doors, prepend=f"## {agent_class.__name__} -")
+            summary_accuracy_over_agents[agent_class.__name__] = report_results(results, f"{host_name} {agent_class.__name__}")
+        reset_file = host == hosts[0]
+        write_results_md(summary_accuracy_over_agents, total_games, reset_file=reset_file, door_count=doors, prepend=f"## {host_name} -")
+        results_summary[host_name] = summary_accuracy_over_agents
+    return results_summary
+
+
+def compare_agents_across_door_counts(agent_classes: list[type[BaseAgent]], door_counts: list[int], total_games: int, output_dir: str = "monty_hall/charts", window: int = 100, workers: int | None = None) -> list[str]:
+    sweep: dict[int, dict[str, list[Result]]] = {}
+    for doors in door_counts:
+        env = Monty(door_count=doors)
+        sweep[doors] = {}
+        for agent_class in agent_classes:
+            agent = agent_class()
+            results = repeat_simulation(env, agent, total_games)
+            report_results(results, f"{agent_class.__name__} ({doors} doors)")
+            sweep[doors][agent_class.__name__] = results
+    return render_charts(sweep_charts(sweep, window=window), output_dir, workers=workers)
+
+
+def compare_accuracy_based_on_game_count(env: Monty, agent_classes: list[type[BaseAgent]], game_counts: list[int], doors: int = 3, show_progress: bool = False):
+    counters = ProgressCounters([agent_class.__name__ for agent_class in agent_classes])
+    with ProgressDisplay(counters) if show_progress else nullcontext():
+        for slot, agent_class in enumerate(agent_classes):
+            summary_accuracy_over_game_count: dict[str, float] = {}
+            for total_games in game_counts:
+                agent = agent_class()
+                results = repeat_simulation_with_progress(env, agent, total_games, counters, slot)
+                win_rate = report_results(results, agent_class.__name__)
+                summary_accuracy_over_game_count[str(total_games)] = win_rate
+            print(f"Agent: {agent_class.__name__}")
+            reset_file = agent_class == agent_classes[0]
+            write_results_md(summary_accuracy_over_game_count, "various", reset_file=reset_file, door_count=doors, prepend=f"## {agent_class.__name__} -")
 
 
 if __name__ == "__main__":
@@ -125,11 +262,16 @@ if __name__ == "__main__":
         # Door2,
         reinforcement_agents.RLItsProbablyFine,
         reinforcement_agents.RLItsProbablyFineDecayingEpsilon,
+        reinforcement_agents.RLDoorCounts,
+        reinforcement_agents.RLDoorCountsReplay,
+        optimal_agents.OptimalPolicy,
     ]
     env = Monty(door_count=doors)
 
     # compare_agents(env, agent_classes, total_games=1000, doors=doors)
-    compare_accuracy_based_on_game_count(env, agent_classes, game_counts, doors=doors)
+    # compare_agents_for_duration(env, agent_classes, seconds=30, doors=doors)
+    # compare_agents_across_door_counts(agent_classes, door_counts=[3, 5, 10, 20], total_games=2000, workers=4)
+    compare_accuracy_based_on_game_count(env, agent_classes, game_counts, doors=doors, show_progress=True)
 
 
 
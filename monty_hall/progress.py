@@ -0,0 +1,138 @@
+"""
+Live progress view for long simulation sweeps.
+
+Runners only add to `ProgressCounters` once per chunk of games or every
+fraction of a second. The counters live in shared memory, so worker processes
+such as the ones started by `work_queue.run_local_workers` can write to them
+as well. A
+`ProgressDisplay` reads them on a background thread at a fixed rate and
+renders a `rich` table, which keeps drawing out of the simulation loop.
+"""
+from dataclasses import dataclass
+import math
+import multiprocessing
+import threading
+import time
+from types import TracebackType
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+
+@dataclass
+class AgentProgress:
+    name: str
+    games: int
+    wins: int
+    games_per_second: float
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def confidence_interval(self) -> float:
+        """
+        Half-width of the 95% normal-approximation interval around the win rate.
+        """
+        if not self.games:
+            return 0.0
+        return 1.96 * math.sqrt(self.win_rate * (1 - self.win_rate) / self.games)
+
+
+class ProgressCounters:
+    """
+    Games and wins per agent slot in shared memory.
+
+    By default each slot must only be written by one process at a time, so no
+    lock is needed. With `shared_slots` several processes may add to the same
+    slot, and every add takes a lock. A reader may see games and wins from
+    slightly different moments, which only matters for a single frame of the
+    display.
+    """
+    def __init__(self, agent_names: list[str], shared_slots: bool = False):
+        self.agent_names = agent_names
+        self._games = multiprocessing.RawArray("q", len(agent_names))
+        self._wins = multiprocessing.RawArray("q", len(agent_names))
+        self._lock = multiprocessing.Lock() if shared_slots else None
+
+    def add(self, slot: int, games: int, wins: int) -> None:
+        if self._lock is None:
+            self._games[slot] += games
+            self._wins[slot] += wins
+            return
+        with self._lock:
+            self._games[slot] += games
+            self._wins[slot] += wins
+
+    def snapshot(self) -> list[tuple[int, int]]:
+        return list(zip(self._games[:], self._wins[:]))
+
+
+class ProgressDisplay:
+    def __init__(self, counters: ProgressCounters, refresh_per_second: float = 4, console: Console | None = None):
+        if refresh_per_second <= 0:
+            raise ValueError("Refresh rate must be positive")
+        self.counters = counters
+        self.interval = 1 / refresh_per_second
+        self._live = Live(console=console, auto_refresh=False)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._last_games = [0] * len(counters.agent_names)
+        self._last_sample = time.perf_counter()
+
+    def sample(self) -> list[AgentProgress]:
+        now = time.perf_counter()
+        elapsed = max(now - self._last_sample, 1e-9)
+        progress: list[AgentProgress] = []
+        for slot, (games, wins) in enumerate(self.counters.snapshot()):
+            progress.append(AgentProgress(
+                name=self.counters.agent_names[slot],
+                games=games,
+                wins=wins,
+                games_per_second=(games - self._last_games[slot]) / elapsed,
+            ))
+            self._last_games[slot] = games
+        self._last_sample = now
+        return progress
+
+    def render(self, progress: list[AgentProgress]) -> Table:
+        table = Table(title="Monty Hall Simulation Progress")
+        table.add_column("Agent")
+        table.add_column("Games", justify="right")
+        table.add_column("Games/sec", justify="right")
+        table.add_column("Win Rate", justify="right")
+        table.add_column("95% CI", justify="right")
+        for agent in progress:
+            table.add_row(
+                agent.name,
+                f"{agent.games:,}",
+                f"{agent.games_per_second:,.0f}",
+                f"{agent.win_rate:.2%}",
+                f"±{agent.confidence_interval:.2%}",
+            )
+        return table
+
+    def _refresh(self) -> None:
+        self._live.update(self.render(self.sample()), refresh=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._refresh()
+
+    def __enter__(self) -> "ProgressDisplay":
+        self._live.start()
+        self._refresh()
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._refresh()
+        self._live.stop()
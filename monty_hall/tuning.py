@@ -0,0 +1,131 @@
+"""
+Parallel hyperparameter search for the tabular RL agents.
+
+`successive_halving` trains every configuration for a small number of games
+across a process pool, keeps the best `1 / eta` by win rate and gives the
+survivors `eta` times more games, until one configuration is left. Losing
+configurations are dropped after the cheap rungs, so most of the budget goes to
+the promising ones.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+import random
+from monty_hall.agents.featurizers import Featurizer, full_state
+from monty_hall.agents.reinforcement_agents import RLItsProbablyFineDecayingEpsilon
+from monty_hall.env.monty import Monty
+from monty_hall.main import repeat_simulation
+
+
+@dataclass(frozen=True)
+class Config:
+    alpha: float
+    initial_epsilon: float
+    decay_rate: float
+    min_epsilon: float = 0.01
+
+    def build_agent(self, featurizer: Featurizer = full_state) -> RLItsProbablyFineDecayingEpsilon:
+        return RLItsProbablyFineDecayingEpsilon(
+            initial_epsilon=self.initial_epsilon,
+            decay_rate=self.decay_rate,
+            featurizer=featurizer,
+            alpha=self.alpha,
+            min_epsilon=self.min_epsilon,
+        )
+
+
+@dataclass(frozen=True)
+class Trial:
+    config: Config
+    games: int
+    win_rate: float
+
+
+@dataclass
+class SearchResult:
+    best: Config
+    trials: list[Trial]
+
+
+def config_grid(alphas: list[float], initial_epsilons: list[float], decay_rates: list[float]) -> list[Config]:
+    """
+    Every combination of the given values. A decay rate of 1 keeps epsilon constant.
+    """
+    return [
+        Config(alpha=alpha, initial_epsilon=epsilon, decay_rate=decay_rate)
+        for alpha, epsilon, decay_rate in product(alphas, initial_epsilons, decay_rates)
+    ]
+
+
+def evaluate_config(config: Config, games: int, door_count: int = 3, seed: int = 0, featurizer: Featurizer = full_state) -> float:
+    """
+    Train a fresh agent for `games` games and return its win rate over the
+    second half, once it has had some time to learn.
+    """
+    random.seed(seed)
+    env = Monty(door_count=door_count, rng=random.Random(seed))
+    results = repeat_simulation(env, config.build_agent(featurizer), games)
+    scored = results[games // 2:]
+    return sum(1 for result in scored if result.won) / len(scored)
+
+
+def successive_halving(
+    configs: list[Config],
+    min_games: int = 200,
+    eta: int = 3,
+    door_count: int = 3,
+    seed: int = 0,
+    featurizer: Featurizer = full_state,
+    max_workers: int | None = None,
+) -> SearchResult:
+    if not configs:
+        raise ValueError("Need at least one config")
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    if min_games < 2:
+        raise ValueError("Need at least two games per trial")
+    trials: list[Trial] = []
+    survivors = list(configs)
+    games = min_games
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for rung in range(len(configs)):
+            # Every config in a rung plays the same seeded games, so they are
+            # compared on equal footing.
+            win_rates = executor.map(
+                evaluate_config,
+                survivors,
+                [games] * len(survivors),
+                [door_count] * len(survivors),
+                [seed + rung] * len(survivors),
+                [featurizer] * len(survivors),
+            )
+            rung_trials = sorted(
+                (Trial(config=config, games=games, win_rate=win_rate) for config, win_rate in zip(survivors, win_rates)),
+                key=lambda trial: trial.win_rate,
+                reverse=True,
+            )
+            trials.extend(rung_trials)
+            survivors = [trial.config for trial in rung_trials[:max(1, len(rung_trials) // eta)]]
+            if len(survivors) == 1:
+                break
+            games *= eta
+    return SearchResult(best=survivors[0], trials=trials)
+
+
+def report_search(search: SearchResult) -> None:
+    for trial in search.trials:
+        config = trial.config
+        print(f"alpha={config.alpha:g} epsilon={config.initial_epsilon:g} decay={config.decay_rate:g}: Games: {trial.games}, Win Rate: {trial.win_rate:.2%}")
+    print(f"Best: {search.best}")
+
+
+if __name__ == "__main__":
+    search = successive_halving(
+        config_grid(
+            alphas=[0.01, 0.05, 0.1, 0.3],
+            initial_epsilons=[0.05, 0.1, 0.2, 0.5],
+            decay_rates=[0.99, 0.999, 1.0],
+        ),
+        min_games=300,
+    )
+    report_search(search)
@@ -0,0 +1,300 @@
+"""
+Distribute sweep cells over worker processes on any number of machines.
+
+Each cell of a door count x game count x agent grid is a row in a SQLite
+database. Put the file on a filesystem every node can reach, or on local disk
+when all workers share one box. Workers claim a cell by leasing it for
+`lease_seconds`, renew the lease every third of that while they play and
+write the win count back when done. Renewal goes by the clock rather than
+by game count, so slow games with many doors do not overrun the lease. A
+cell whose lease runs out, because its worker died or lost the filesystem,
+simply becomes claimable again.
+
+SQLite's default rollback journal is used rather than WAL, because WAL needs
+shared memory and does not work on network filesystems.
+"""
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass
+import inspect
+from itertools import product
+import multiprocessing
+import os
+import random
+import socket
+import sqlite3
+import time
+from monty_hall.agents import non_ai_agents, optimal_agents, reinforcement_agents
+from monty_hall.agents.base import BaseAgent
+from monty_hall.env.monty import Monty
+from monty_hall.main import run_simulation
+from monty_hall.progress import ProgressCounters, ProgressDisplay
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+
+_MIN_POLL_SECONDS = 0.05
+_PROGRESS_SECONDS = 0.25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cells (
+    id INTEGER PRIMARY KEY,
+    agent TEXT NOT NULL,
+    door_count INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER,
+    UNIQUE (agent, door_count, games)
+)
+"""
+
+
+@dataclass(frozen=True)
+class Cell:
+    id: int
+    agent: str
+    door_count: int
+    games: int
+    status: str = PENDING
+    worker: str | None = None
+    attempts: int = 0
+    wins: int | None = None
+
+    @property
+    def win_rate(self) -> float:
+        if self.wins is None:
+            raise ValueError("Cell not done")
+        return self.wins / self.games
+
+
+class SweepStore:
+    def __init__(self, path: str, clock: Callable[[], float] = time.time, timeout: float = 30.0):
+        self.path = path
+        self.clock = clock
+        # Transactions are managed explicitly so claims can take the write
+        # lock up front with BEGIN IMMEDIATE.
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def add_cells(self, agent_names: list[str], door_counts: list[int], game_counts: list[int]) -> int:
+        """
+        Queue every combination that is not already in the store and return how many were added.
+        """
+        before = self._connection.total_changes
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO cells (agent, door_count, games) VALUES (?, ?, ?)",
+            product(agent_names, door_counts, game_counts),
+        )
+        return self._connection.total_changes - before
+
+    def claim(self, worker: str, lease_seconds: float) -> Cell | None:
+        now = self.clock()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._connection.execute(
+                "SELECT id FROM cells WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                self._connection.execute("COMMIT")
+                return None
+            self._connection.execute(
+                "UPDATE cells SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (LEASED, worker, now + lease_seconds, row[0]),
+            )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        return self.get(row[0])
+
+    def heartbeat(self, cell_id: int, worker: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease, returning False if the worker no longer holds it.
+        """
+        cursor = self._connection.execute(
+            "UPDATE cells SET lease_expires = ? WHERE id = ? AND worker = ? AND status = ?",
+            (self.clock() + lease_seconds, cell_id, worker, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, cell_id: int, worker: str, wins: int) -> bool:
+        cursor = self._connection.execute(
+            "UPDATE cells SET status = ?, wins = ?, lease_expires = NULL WHERE id = ? AND worker = ? AND status = ?",
+            (DONE, wins, cell_id, worker, LEASED),
+        )
+        return cursor.rowcount == 1
+
+    def get(self, cell_id: int) -> Cell:
+        row = self._connection.execute(
+            "SELECT id, agent, door_count, games, status, worker, attempts, wins FROM cells WHERE id = ?",
+            (cell_id,),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown cell: {cell_id}")
+        return Cell(*row)
+
+    def cells(self, status: str | None = None) -> list[Cell]:
+        query = "SELECT id, agent, door_count, games, status, worker, attempts, wins FROM cells"
+        if status:
+            rows = self._connection.execute(query + " WHERE status = ? ORDER BY id", (status,))
+        else:
+            rows = self._connection.execute(query + " ORDER BY id")
+        return [Cell(*row) for row in rows]
+
+    def next_lease_expiry(self) -> float | None:
+        return self._connection.execute("SELECT MIN(lease_expires) FROM cells WHERE status = ?", (LEASED,)).fetchone()[0]
+
+    def remaining(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM cells WHERE status != ?", (DONE,)).fetchone()[0]
+
+
+def known_agents() -> dict[str, type[BaseAgent]]:
+    """
+    Every concrete agent class that can be built without arguments, by name.
+    """
+    agents: dict[str, type[BaseAgent]] = {}
+    for module in (non_ai_agents, reinforcement_agents, optimal_agents):
+        for value in vars(module).values():
+            if isinstance(value, type) and issubclass(value, BaseAgent) and not inspect.isabstract(value):
+                agents[value.__name__] = value
+    return agents
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_cell(store: SweepStore, cell: Cell, worker: str, agent_class: type[BaseAgent], lease_seconds: float, counters: ProgressCounters | None = None) -> bool:
+    """
+    Play a claimed cell, renewing its lease every third of `lease_seconds` by
+    the store's clock, however long each game takes. Returns False if the
+    lease was lost on the way, in which case the cell is left to its new owner.
+    """
+    random.seed(cell.id)
+    env = Monty(door_count=cell.door_count, rng=random.Random(cell.id))
+    agent = agent_class()
+    slot = counters.agent_names.index(cell.agent) if counters else 0
+    renew_every = lease_seconds / 3
+    now = store.clock()
+    renew_at = now + renew_every
+    report_at = now + _PROGRESS_SECONDS
+    wins = 0
+    reported_games = reported_wins = 0
+    for played in range(1, cell.games + 1):
+        wins += run_simulation(env, agent).won
+        now = store.clock()
+        if counters and now >= report_at:
+            counters.add(slot, played - reported_games, wins - reported_wins)
+            reported_games, reported_wins = played, wins
+            report_at = now + _PROGRESS_SECONDS
+        if now >= renew_at:
+            if not store.heartbeat(cell.id, worker, lease_seconds):
+                return False
+            renew_at = now + renew_every
+    if counters:
+        counters.add(slot, cell.games - reported_games, wins - reported_wins)
+    return store.complete(cell.id, worker, wins)
+
+
+def run_worker(path: str, worker: str | None = None, lease_seconds: float = 60.0, poll_seconds: float = 1.0, counters: ProgressCounters | None = None) -> int:
+    """
+    Claim and play cells until every cell is done. Returns how many this worker completed.
+
+    While the remaining cells are leased to other workers it polls every
+    `poll_seconds`, or sooner if the earliest lease runs out first, so cells
+    of workers that died get picked up.
+    """
+    worker = worker or default_worker_id()
+    agents = known_agents()
+    store = SweepStore(path)
+    completed = 0
+    try:
+        while store.remaining():
+            cell = store.claim(worker, lease_seconds)
+            if cell is None:
+                expiry = store.next_lease_expiry()
+                if expiry is not None:
+                    time.sleep(min(max(expiry - store.clock(), _MIN_POLL_SECONDS), poll_seconds))
+                continue
+            if cell.agent not in agents:
+                raise ValueError(f"Unknown agent: {cell.agent}")
+            if run_cell(store, cell, worker, agents[cell.agent], lease_seconds, counters):
+                completed += 1
+    finally:
+        store.close()
+    return completed
+
+
+def progress_counters(store: SweepStore) -> ProgressCounters:
+    """
+    Counters with one slot per agent in the store, shared by every worker process.
+    """
+    return ProgressCounters(sorted({cell.agent for cell in store.cells()}), shared_slots=True)
+
+
+def run_local_workers(path: str, workers: int, lease_seconds: float = 60.0, counters: ProgressCounters | None = None) -> None:
+    """
+    Run `workers` worker processes on this machine against the same store.
+    Pass `counters` from `progress_counters` to follow them with a `ProgressDisplay`.
+    """
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(path,), kwargs={"lease_seconds": lease_seconds, "counters": counters})
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    if any(process.exitcode for process in processes):
+        raise RuntimeError("Sweep worker failed")
+
+
+def report_cells(cells: list[Cell]) -> None:
+    for cell in cells:
+        print(f"{cell.agent}: Doors: {cell.door_count}, Total games: {cell.games}, Wins: {cell.wins}, Win Rate: {cell.win_rate:.2%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared work queue for Monty Hall sweeps.")
+    parser.add_argument("store", help="SQLite file every worker can reach")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="queue a sweep grid")
+    add.add_argument("--agents", nargs="+", required=True)
+    add.add_argument("--doors", nargs="+", type=int, required=True)
+    add.add_argument("--games", nargs="+", type=int, required=True)
+    work = commands.add_parser("work", help="run workers on this machine")
+    work.add_argument("--workers", type=int, default=1)
+    work.add_argument("--lease-seconds", type=float, default=60.0)
+    work.add_argument("--progress", action="store_true", help="show a live progress table")
+    commands.add_parser("report", help="print finished cells")
+    args = parser.parse_args()
+
+    if args.command == "add":
+        unknown = set(args.agents) - set(known_agents())
+        if unknown:
+            parser.error(f"Unknown agents: {', '.join(sorted(unknown))}")
+        sweep_store = SweepStore(args.store)
+        print(f"Queued {sweep_store.add_cells(args.agents, args.doors, args.games)} cells")
+        sweep_store.close()
+    elif args.command == "work":
+        if args.progress:
+            sweep_store = SweepStore(args.store)
+            counters = progress_counters(sweep_store)
+            sweep_store.close()
+            with ProgressDisplay(counters):
+                run_local_workers(args.store, args.workers, lease_seconds=args.lease_seconds, counters=counters)
+        else:
+            run_local_workers(args.store, args.workers, lease_seconds=args.lease_seconds)
+    else:
+        sweep_store = SweepStore(args.store)
+        report_cells(sweep_store.cells(DONE))
+        print(f"Remaining: {sweep_store.remaining()}")
+        sweep_store.close()
@@ -0,0 +1,76 @@
+import random
+from monty_hall.agents.convergence import ConvergenceMonitor
+from monty_hall.agents.featurizers import door_counts
+from monty_hall.agents.reinforcement_agents import RLItsProbablyFineDecayingEpsilon
+from monty_hall.env.monty import Monty
+from monty_hall.main import repeat_simulation, repeat_simulation_until_converged
+
+
+class TestConvergenceMonitor:
+    def test_converges_after_stable_window(self):
+        monitor = ConvergenceMonitor(window=3)
+        monitor.observe_update(0.0, 10.0, policy_changed=True)
+        assert not monitor.end_game()
+        assert not monitor.end_game()
+        assert not monitor.end_game()
+        assert monitor.end_game()
+
+    def test_policy_change_restarts_window(self):
+        monitor = ConvergenceMonitor(window=2)
+        monitor.end_game()
+        monitor.observe_update(0.0, 10.0, policy_changed=True)
+        assert not monitor.end_game()
+        assert not monitor.end_game()
+        assert monitor.end_game()
+
+    def test_q_delta_tolerance(self):
+        monitor = ConvergenceMonitor(window=1, max_q_delta=0.5)
+        monitor.observe_update(10.0, 11.0, policy_changed=False)
+        assert not monitor.end_game()
+        monitor.observe_update(10.0, 10.25, policy_changed=False)
+        assert monitor.end_game()
+
+    def test_waits_for_min_games(self):
+        monitor = ConvergenceMonitor(window=1, min_games=3)
+        assert not monitor.end_game()
+        assert not monitor.end_game()
+        assert monitor.end_game()
+
+
+class TestFrozenAgent:
+    def _agent(self) -> RLItsProbablyFineDecayingEpsilon:
+        return RLItsProbablyFineDecayingEpsilon(featurizer=door_counts, convergence=ConvergenceMonitor(window=200))
+
+    def test_freezes_after_converging(self):
+        random.seed(42)
+        agent = self._agent()
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 3000)
+        assert agent.frozen
+        assert agent.frozen_at is not None and agent.frozen_at < 3000
+        assert agent.epsilon == 0
+
+    def test_frozen_agent_stops_learning(self):
+        random.seed(42)
+        agent = self._agent()
+        agent.freeze()
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 100)
+        assert all(value == 0 for actions in agent._q_table.values() for value in actions.values())
+        assert agent.epsilon == 0
+
+    def test_splits_training_and_evaluation(self):
+        random.seed(42)
+        agent = self._agent()
+        training, evaluation = repeat_simulation_until_converged(Monty(rng=random.Random(42)), agent, 5000, 2000)
+        assert len(training) == agent.frozen_at
+        assert len(training) < 5000
+        assert len(evaluation) == 2000
+        win_rate = sum(result.won for result in evaluation) / len(evaluation)
+        assert abs(win_rate - 2 / 3) < 0.03
+
+    def test_freezes_at_training_limit(self):
+        random.seed(42)
+        agent = RLItsProbablyFineDecayingEpsilon(convergence=ConvergenceMonitor(window=10000))
+        training, evaluation = repeat_simulation_until_converged(Monty(rng=random.Random(42)), agent, 50, 10)
+        assert len(training) == 50
+        assert len(evaluation) == 10
+        assert agent.frozen_at == 50
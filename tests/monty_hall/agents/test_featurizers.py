@@ -0,0 +1,26 @@
+import random
+from monty_hall.agents.featurizers import door_counts, door_counts_and_switched, full_state
+from monty_hall.env.monty import Monty
+
+
+class TestFeaturizers:
+    def test_full_state_is_the_observation(self):
+        monty = Monty(rng=random.Random(42))
+        state = monty.get_state()
+        assert full_state(state, False) == state
+
+    def test_door_counts_ignore_door_identity(self):
+        first = Monty(door_count=5, rng=random.Random(1))
+        second = Monty(door_count=5, rng=random.Random(2))
+        first.select_door(0)
+        first.host_opens_door()
+        second.select_door(3)
+        second.host_opens_door()
+        assert first.get_state() != second.get_state()
+        assert door_counts(first.get_state(), False) == door_counts(second.get_state(), False) == (4, 1)
+
+    def test_door_counts_and_switched_tracks_switching(self):
+        monty = Monty(rng=random.Random(42))
+        state = monty.get_state()
+        assert door_counts_and_switched(state, False) == (3, 0, False)
+        assert door_counts_and_switched(state, True) == (3, 0, True)
@@ -0,0 +1,51 @@
+import random
+from fractions import Fraction
+from monty_hall.agents.optimal_agents import OptimalPolicy, solve
+from monty_hall.env.monty import Monty, Action
+from monty_hall.main import repeat_simulation
+
+
+class TestSolve:
+    def test_classic_game_switches(self):
+        solution = solve(3)
+        assert solution.value == Fraction(2, 3)
+        assert solution.policy == {2: Action.SWITCH}
+
+    def test_two_doors_has_no_decision(self):
+        solution = solve(2)
+        assert solution.value == Fraction(1, 2)
+        assert solution.policy == {}
+
+    def test_stays_until_the_last_door(self):
+        solution = solve(10)
+        assert solution.value == Fraction(9, 10)
+        assert solution.policy[2] == Action.SWITCH
+        assert all(solution.policy[closed] == Action.STAY for closed in range(3, 10))
+
+    def test_scales_to_many_doors(self):
+        solution = solve(2000)
+        assert solution.value == Fraction(1999, 2000)
+        assert len(solution.policy) == 1998
+
+    def test_fails_with_fewer_than_two_doors(self):
+        try:
+            solve(1)
+        except ValueError as e:
+            assert str(e) == "Need at least two doors"
+        else:
+            assert False, "Expected ValueError not raised"
+
+
+class TestOptimalPolicy:
+    def test_matches_solved_value(self):
+        env = Monty(door_count=10, rng=random.Random(42))
+        results = repeat_simulation(env, OptimalPolicy(), 2000)
+        win_rate = sum(result.won for result in results) / len(results)
+        assert abs(win_rate - 0.9) < 0.03
+
+    def test_follows_door_count_changes(self):
+        agent = OptimalPolicy()
+        repeat_simulation(Monty(door_count=3, rng=random.Random(42)), agent, 1)
+        repeat_simulation(Monty(door_count=5, rng=random.Random(42)), agent, 1)
+        assert agent.solution
+        assert agent.solution.door_count == 5
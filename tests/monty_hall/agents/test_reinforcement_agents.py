@@ -0,0 +1,42 @@
+import random
+from monty_hall.agents.featurizers import door_counts_and_switched
+from monty_hall.agents.reinforcement_agents import RLDoorCounts, RLItsProbablyFine, RLItsProbablyFineDecayingEpsilon
+from monty_hall.env.monty import Monty
+from monty_hall.main import repeat_simulation
+
+
+class TestFeaturizedQTable:
+    def test_full_state_table_grows_with_door_identities(self):
+        random.seed(42)
+        agent = RLItsProbablyFine()
+        repeat_simulation(Monty(door_count=8, rng=random.Random(42)), agent, 500)
+        assert len(agent._q_table) > 100
+
+    def test_door_count_table_is_bounded_by_door_count(self):
+        random.seed(42)
+        agent = RLDoorCounts()
+        repeat_simulation(Monty(door_count=8, rng=random.Random(42)), agent, 500)
+        assert len(agent._q_table) <= 8
+
+    def test_tracks_switching_within_a_game(self):
+        random.seed(42)
+        agent = RLItsProbablyFine(featurizer=door_counts_and_switched)
+        agent.epsilon = 1.0
+        repeat_simulation(Monty(door_count=5, rng=random.Random(42)), agent, 200)
+        assert any(key[2] for key in agent._q_table)  # type: ignore
+        agent.reset()
+        assert not agent.has_switched
+
+
+class TestDecayingEpsilon:
+    def test_uses_given_decay_rate(self):
+        random.seed(42)
+        agent = RLItsProbablyFineDecayingEpsilon(initial_epsilon=0.5, decay_rate=0.5)
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 3)
+        assert agent.epsilon == 0.5 * 0.5 ** 3
+
+    def test_does_not_drop_below_min_epsilon(self):
+        random.seed(42)
+        agent = RLItsProbablyFineDecayingEpsilon(initial_epsilon=0.5, decay_rate=0.1, min_epsilon=0.05)
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 10)
+        assert agent.epsilon == 0.05
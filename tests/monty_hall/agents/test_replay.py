@@ -0,0 +1,78 @@
+import random
+import numpy as np
+from monty_hall.agents.featurizers import door_counts
+from monty_hall.agents.reinforcement_agents import BaseQAgent, RLItsProbablyFine, RLItsProbablyFineReplay
+from monty_hall.agents.replay import ReplayBuffer, batch_update
+from monty_hall.env.monty import Action, Monty
+from monty_hall.main import repeat_simulation
+
+
+class TestReplayBuffer:
+    def test_overwrites_oldest_when_full(self):
+        buffer = ReplayBuffer(capacity=3, seed=42)
+        for state in range(5):
+            buffer.add(state, 1, 100.0)
+        assert len(buffer) == 3
+        assert sorted(buffer.states.tolist()) == [2, 3, 4]
+
+    def test_samples_only_stored_transitions(self):
+        buffer = ReplayBuffer(capacity=10, seed=42)
+        buffer.add(4, 2, 100.0)
+        buffer.add(5, 1, 0.0)
+        states, actions, rewards = buffer.sample(50)
+        assert states.shape == actions.shape == rewards.shape == (50,)
+        assert set(states.tolist()) <= {4, 5}
+        assert all(reward == (100.0 if state == 4 else 0.0) for state, reward in zip(states, rewards))
+
+    def test_fails_to_sample_when_empty(self):
+        try:
+            ReplayBuffer(capacity=2).sample(1)
+        except ValueError as e:
+            assert str(e) == "Cannot sample from an empty buffer"
+        else:
+            assert False, "Expected ValueError not raised"
+
+
+class TestBatchUpdate:
+    def test_averages_repeated_transitions(self):
+        q_values = np.zeros((2, 3))
+        batch_update(q_values, np.array([0, 0, 1]), np.array([1, 1, 2]), np.array([100.0, 0.0, 100.0]), alpha=0.5)
+        assert q_values[0, 1] == 25.0
+        assert q_values[1, 2] == 50.0
+        assert q_values.sum() == 75.0
+
+
+class TestReplayAgent:
+    def test_learns_to_switch(self):
+        random.seed(42)
+        agent = RLItsProbablyFineReplay(featurizer=door_counts, seed=42)
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 300)
+        assert agent._greedy_action((2, 1)) == Action.SWITCH
+        assert len(agent.replay) == 300
+
+    def test_grows_q_values_for_new_states(self):
+        random.seed(42)
+        agent = RLItsProbablyFineReplay(seed=42)
+        repeat_simulation(Monty(door_count=6, rng=random.Random(42)), agent, 200)
+        assert len(agent._state_ids) > 16
+        assert len(agent.q_values) >= len(agent._state_ids)
+
+    def test_frozen_agent_stops_replaying(self):
+        random.seed(42)
+        agent = RLItsProbablyFineReplay(featurizer=door_counts, seed=42)
+        agent.freeze()
+        repeat_simulation(Monty(rng=random.Random(42)), agent, 50)
+        assert len(agent.replay) == 0
+        assert not agent.q_values.any()
+        assert not agent._state_ids
+
+    def test_greedy_reads_do_not_register_states(self):
+        agent = RLItsProbablyFineReplay(featurizer=door_counts, seed=42)
+        assert agent._greedy_action((5, 0)) == Action.STAY
+        assert not agent._state_ids
+        assert len(agent.q_values) == 16
+
+    def test_is_a_sibling_of_the_dict_agent(self):
+        agent = RLItsProbablyFineReplay()
+        assert isinstance(agent, BaseQAgent)
+        assert not isinstance(agent, RLItsProbablyFine)
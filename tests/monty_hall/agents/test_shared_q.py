@@ -0,0 +1,78 @@
+import random
+from monty_hall.agents.featurizers import door_counts_and_switched, full_state
+from monty_hall.agents.reinforcement_agents import RLItsProbablyFine
+from monty_hall.agents.shared_q import SharedQAgent, SharedQTable, train_hogwild
+from monty_hall.env.monty import Action, Monty
+from monty_hall.main import repeat_simulation
+
+
+class TestSharedQTable:
+    def test_reads_and_writes_like_a_q_table(self):
+        table = SharedQTable(door_count=3)
+        try:
+            table[(2, 1)][Action.SWITCH.value] = 5.0
+            assert table[(2, 1)][Action.SWITCH.value] == 5.0
+            assert table[(2, 1, True)][Action.SWITCH.value] == 0.0
+            assert table[(3, 0)][Action.STAY.value] == 0.0
+        finally:
+            table.close()
+
+    def test_attaches_by_name(self):
+        table = SharedQTable(door_count=4)
+        other = SharedQTable(door_count=4, name=table.name)
+        try:
+            other[(3, 1)][Action.STAY.value] = 2.5
+            assert table[(3, 1)][Action.STAY.value] == 2.5
+        finally:
+            other.close()
+            table.close()
+
+    def test_loads_into_agent(self):
+        table = SharedQTable(door_count=3)
+        try:
+            table[(2, 1, True)][Action.SWITCH.value] = 7.0
+            agent = RLItsProbablyFine(featurizer=door_counts_and_switched)
+            table.load_into(agent)
+            assert agent._q_table[(2, 1, True)][Action.SWITCH.value] == 7.0
+        finally:
+            table.close()
+
+
+class TestSharedQAgent:
+    def test_learns_into_shared_table(self):
+        random.seed(42)
+        table = SharedQTable(door_count=3)
+        try:
+            agent = SharedQAgent(table)
+            repeat_simulation(Monty(rng=random.Random(42)), agent, 500)
+            assert table[(2, 1)][Action.SWITCH.value] > table[(2, 1)][Action.STAY.value]
+            del agent
+        finally:
+            table.close()
+
+    def test_rejects_full_state_featurizer(self):
+        table = SharedQTable(door_count=3)
+        try:
+            SharedQAgent(table, featurizer=full_state)
+        except ValueError as e:
+            assert str(e) == "Shared Q-tables need a count based featurizer"
+        else:
+            assert False, "Expected ValueError not raised"
+        finally:
+            table.close()
+
+
+class TestTrainHogwild:
+    def test_workers_learn_to_switch(self):
+        agent = train_hogwild(door_count=3, games_per_worker=1000, workers=3, alpha=0.02)
+        features = (2, 1)
+        assert agent._q_table[features][Action.SWITCH.value] > agent._q_table[features][Action.STAY.value]
+        random.seed(42)
+        agent.epsilon = 0
+        results = repeat_simulation(Monty(rng=random.Random(42)), agent, 1000)
+        assert abs(sum(result.won for result in results) / 1000 - 2 / 3) < 0.05
+
+    def test_striped_locks(self):
+        agent = train_hogwild(door_count=5, games_per_worker=300, workers=2, featurizer=door_counts_and_switched, lock_stripes=2)
+        assert agent._q_table
+        assert all(len(features) == 3 for features in agent._q_table)  # type: ignore
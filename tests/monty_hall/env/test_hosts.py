@@ -0,0 +1,98 @@
+import random
+import numpy as np
+from monty_hall.agents.non_ai_agents import AlwaysSwitch, Stander
+from monty_hall.env.hosts import BaseHost, ClassicHost, DecoyHost, IgnorantHost, RandomHost
+from monty_hall.env.monty import Monty
+from monty_hall.env.vector import DOOR_SELECTED, VectorMonty
+from monty_hall.main import compare_agents_across_hosts, repeat_simulation
+
+
+def _scalar_win_rate(host: BaseHost, agent_class: type, games: int = 6000) -> float:
+    random.seed(42)
+    env = Monty(rng=random.Random(42), host=host)
+    results = repeat_simulation(env, agent_class(), games)
+    return sum(result.won for result in results) / games
+
+
+def _vector_win_rate(host: BaseHost, switch: bool, games: int = 6000) -> float:
+    env = VectorMonty(num_envs=1000, seed=42, host=host)
+    observation = env.reset()
+    finished = 0
+    wins = 0
+    while finished < games:
+        selecting = (observation != DOOR_SELECTED).all(axis=1)
+        actions = np.full(env.num_envs, env.switch_action if switch else env.stay_action)
+        actions[selecting] = 0
+        observation, _, dones, info = env.step(actions)
+        finished += dones.sum()
+        wins += info["won"].sum()
+    return wins / finished
+
+
+class TestClassicHost:
+    def test_never_opens_selected_or_winning_door(self):
+        rng = np.random.default_rng(42)
+        open_doors = np.zeros((1000, 5), dtype=bool)
+        selected = rng.integers(0, 5, size=1000)
+        winning = rng.integers(0, 5, size=1000)
+        opened = ClassicHost().choose_doors(open_doors, selected, winning, rng)
+        assert (opened != selected).all()
+        assert (opened != winning).all()
+
+    def test_switching_wins_two_thirds(self):
+        assert abs(_scalar_win_rate(ClassicHost(), AlwaysSwitch) - 2 / 3) < 0.03
+        assert abs(_vector_win_rate(ClassicHost(), switch=True) - 2 / 3) < 0.03
+
+
+class TestIgnorantHost:
+    def test_sometimes_opens_winning_door(self):
+        rng = np.random.default_rng(42)
+        open_doors = np.zeros((1000, 3), dtype=bool)
+        selected = np.zeros(1000, dtype=np.int64)
+        winning = np.ones(1000, dtype=np.int64)
+        opened = IgnorantHost().choose_doors(open_doors, selected, winning, rng)
+        assert (opened != selected).all()
+        assert (opened == winning).any()
+
+    def test_switching_wins_one_third(self):
+        assert abs(_scalar_win_rate(IgnorantHost(), AlwaysSwitch) - 1 / 3) < 0.03
+        assert abs(_vector_win_rate(IgnorantHost(), switch=True) - 1 / 3) < 0.03
+
+
+class TestRandomHost:
+    def test_mixes_classic_and_ignorant_hosts(self):
+        assert abs(_scalar_win_rate(RandomHost(ignorant_rate=0.5), AlwaysSwitch) - 1 / 2) < 0.03
+        assert abs(_vector_win_rate(RandomHost(ignorant_rate=0.5), switch=True) - 1 / 2) < 0.03
+
+
+class TestDecoyHost:
+    def test_always_lying_makes_switching_lose(self):
+        assert _scalar_win_rate(DecoyHost(lie_rate=1.0), AlwaysSwitch) == 0
+        assert _vector_win_rate(DecoyHost(lie_rate=1.0), switch=True) == 0
+
+    def test_staying_is_unaffected(self):
+        assert abs(_scalar_win_rate(DecoyHost(lie_rate=1.0), Stander) - 1 / 3) < 0.03
+        assert abs(_vector_win_rate(DecoyHost(lie_rate=1.0), switch=False) - 1 / 3) < 0.03
+
+    def test_only_lies_once_per_game(self):
+        rng = np.random.default_rng(42)
+        open_doors = np.zeros((2, 5), dtype=bool)
+        open_doors[0, 3] = True
+        selected = np.array([0, 0])
+        winning = np.array([3, 3])
+        opened = DecoyHost(lie_rate=1.0).choose_doors(open_doors, selected, winning, rng)
+        assert opened[0] not in (0, 3)
+        assert opened[1] == 3
+        assert not open_doors[np.arange(2), opened].any()
+
+
+class TestCompareAgentsAcrossHosts:
+    def test_sweeps_every_host_and_agent(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "monty_hall").mkdir()
+        summary = compare_agents_across_hosts([Stander, AlwaysSwitch], [ClassicHost(), DecoyHost(lie_rate=1.0)], 300)
+        assert set(summary) == {"ClassicHost", "DecoyHost"}
+        assert summary["DecoyHost"]["AlwaysSwitch"] == 0
+        results_md = (tmp_path / "monty_hall" / "results.md").read_text()
+        assert "## ClassicHost -" in results_md
+        assert "## DecoyHost -" in results_md
@@ -1,5 +1,5 @@
 import random
-from monty_hall.env.monty import Monty, ActionType, State, StepResult, Result, Action
+from monty_hall.env.monty import Monty, ActionType, Door, State, StepResult, Result, Action
 
 class TestInit:
     def test_creates_doors(self):
@@ -28,12 +28,26 @@ class TestReset:
         monty.last_action = ActionType.USER_ACTION
         monty.reset()
 
-        assert monty.doors != original_doors
+        assert all(door is original for door, original in zip(monty.doors, original_doors))
         assert monty.winning_door != original_winning_door
         assert monty.selected_door is None
         assert all(not door.is_open for door in monty.doors)
         assert monty.last_action is None
 
+    def test_reset_reallocates_doors_when_door_count_changes(self):
+        rng = random.Random(42)
+        monty = Monty(rng=rng)
+        monty.door_count = 5
+        monty.reset()
+        assert len(monty.doors) == 5
+        assert len(monty.get_state().available_doors) == 5
+
+    def test_core_types_have_no_instance_dict(self):
+        monty = Monty(rng=random.Random(42))
+        step_result = monty.select_door(0)
+        for value in (monty.doors[0], monty.get_state(), step_result, Result(won=True)):
+            assert not hasattr(value, "__dict__")
+
 class TestSelectDoor:
     def test_selects_door(self):
         rng = random.Random(42)
@@ -367,6 +381,20 @@ class TestGetState:
             open_doors=(monty.doors[0], )
         )
 
+    def test_state_does_not_change_when_doors_are_reused(self):
+        rng = random.Random(42)
+        monty = Monty(rng=rng)
+        monty.select_door(2)
+        state = monty.get_state()
+        monty.host_opens_door()
+        monty.reset()
+        monty.doors[1].is_open = True
+        assert state == State(
+            available_doors=(Door(index=0), Door(index=1), Door(index=2)),
+            selected_door=Door(index=2),
+            open_doors=()
+        )
+
 class TestGetResult:
     def test_returns_result_after_game(self):
         rng = random.Random(42)
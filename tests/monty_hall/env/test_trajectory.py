@@ -0,0 +1,81 @@
+import random
+from monty_hall.agents.non_ai_agents import SmartSwitcher
+from monty_hall.env.monty import Monty, Action, Result, StepResult
+from monty_hall.env.trajectory import ACTION_CODES, NO_ACTION, Event, TrajectoryRecorder, load_trajectory
+from monty_hall.main import repeat_simulation
+
+
+class TestTrajectoryRecorder:
+    def test_round_trips_records(self, tmp_path):
+        path = str(tmp_path / "log.bin")
+        step_results = [StepResult(action=Action.CHOOSE, score_delta=0), StepResult(action=Action.SWITCH, score_delta=100)]
+        with TrajectoryRecorder(path) as recorder:
+            recorder.record_game(step_results, [1, 0, 2], Result(won=True, score=100), 2)
+            recorder.record_game(step_results[:1] * 2, [0, 2, 0], Result(won=False), 1)
+        log = load_trajectory(path)
+        assert list(log["game"]) == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert list(log["event"]) == [Event.AGENT_ACTION, Event.HOST_REVEAL, Event.AGENT_ACTION, Event.RESULT] * 2
+        assert list(log["step"]) == [0, 1, 2, 3] * 2
+        assert list(log["door"]) == [1, 0, 2, 2, 0, 2, 0, 1]
+        assert list(log["action"][:4]) == [ACTION_CODES[Action.CHOOSE], NO_ACTION, ACTION_CODES[Action.SWITCH], NO_ACTION]
+        assert list(log["score_delta"][:4]) == [0, 0, 100, 100]
+        assert list(log["won"]) == [0, 0, 0, 1, 0, 0, 0, 0]
+
+    def test_rejects_unpaired_reveals(self, tmp_path):
+        with TrajectoryRecorder(str(tmp_path / "log.bin")) as recorder:
+            try:
+                recorder.record_game([StepResult(action=Action.CHOOSE, score_delta=0)], [1, 0], Result(won=False), 2)
+            except ValueError as e:
+                assert str(e) == "Every host reveal must sit between two agent actions"
+            else:
+                assert False, "Expected ValueError not raised"
+
+    def test_flushes_in_chunks(self, tmp_path):
+        path = str(tmp_path / "log.bin")
+        recorder = TrajectoryRecorder(path, chunk_size=5)
+        step_results = [StepResult(action=Action.CHOOSE, score_delta=0)] * 2
+        for _ in range(3):
+            recorder.record_game(step_results, [0, 1, 0], Result(won=False), 2)
+        assert len(load_trajectory(path)) == 8
+        recorder.close()
+        assert list(load_trajectory(path)["game"]) == [0] * 4 + [1] * 4 + [2] * 4
+
+    def test_steps_past_16_bits(self, tmp_path):
+        path = str(tmp_path / "log.bin")
+        reveals = 35000
+        step_results = [StepResult(action=Action.STAY, score_delta=0)] * (reveals + 1)
+        with TrajectoryRecorder(path) as recorder:
+            recorder.record_game(step_results, [0] * (2 * reveals + 1), Result(won=False), 1)
+        assert load_trajectory(path)["step"][-1] == 2 * reveals + 1
+
+    def test_loads_empty_log(self, tmp_path):
+        path = str(tmp_path / "log.bin")
+        TrajectoryRecorder(path).close()
+        assert len(load_trajectory(path)) == 0
+
+    def test_fails_on_truncated_log(self, tmp_path):
+        path = tmp_path / "log.bin"
+        path.write_bytes(b"\x00" * 7)
+        try:
+            load_trajectory(str(path))
+        except ValueError as e:
+            assert str(e) == "Trajectory file is truncated"
+        else:
+            assert False, "Expected ValueError not raised"
+
+
+class TestRecordingSimulations:
+    def test_records_every_game(self, tmp_path):
+        random.seed(42)
+        path = str(tmp_path / "log.bin")
+        env = Monty(door_count=4, rng=random.Random(42))
+        with TrajectoryRecorder(path) as recorder:
+            results = repeat_simulation(env, SmartSwitcher(), 10, recorder)
+        log = load_trajectory(path)
+        final = log[log["event"] == Event.RESULT]
+        assert list(final["game"]) == list(range(10))
+        assert list(final["won"]) == [result.won for result in results]
+        assert list(final["score_delta"]) == [100 if result.won else 0 for result in results]
+        # choose, then two reveals each followed by an action, then the result
+        assert len(log) == 10 * 6
+        assert (log["event"] == Event.HOST_REVEAL).sum() == 20
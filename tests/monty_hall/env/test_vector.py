@@ -0,0 +1,97 @@
+import numpy as np
+from monty_hall.env.vector import DOOR_CLOSED, DOOR_OPEN, DOOR_SELECTED, WIN_SCORE, VectorMonty
+
+
+def _play(env: VectorMonty, games: int, switch_when_closed: int) -> float:
+    """
+    Pick door 0, then stay until `switch_when_closed` doors are closed and switch.
+    """
+    observation = env.reset()
+    finished = 0
+    wins = 0
+    while finished < games:
+        closed = (observation != DOOR_OPEN).sum(axis=1)
+        selecting = (observation != DOOR_SELECTED).all(axis=1)
+        actions = np.where(closed == switch_when_closed, env.switch_action, env.stay_action)
+        actions[selecting] = 0
+        observation, _, dones, info = env.step(actions)
+        finished += dones.sum()
+        wins += info["won"].sum()
+    return wins / finished
+
+
+class TestReset:
+    def test_starts_with_all_doors_closed(self):
+        env = VectorMonty(num_envs=4, door_count=5, seed=42)
+        observation = env.reset()
+        assert observation.shape == (4, 5)
+        assert (observation == DOOR_CLOSED).all()
+
+    def test_only_doors_can_be_chosen_first(self):
+        env = VectorMonty(num_envs=2, door_count=3, seed=42)
+        mask = env.action_mask()
+        assert mask.shape == (2, 5)
+        assert mask[:, :3].all()
+        assert not mask[:, env.stay_action].any()
+        assert not mask[:, env.switch_action].any()
+
+    def test_fails_with_too_few_doors(self):
+        try:
+            VectorMonty(num_envs=1, door_count=1)
+        except ValueError as e:
+            assert str(e) == "Need at least two doors"
+        else:
+            assert False, "Expected ValueError not raised"
+
+
+class TestStep:
+    def test_host_opens_a_door_after_selecting(self):
+        env = VectorMonty(num_envs=100, door_count=3, seed=42)
+        env.reset()
+        observation, rewards, dones, _ = env.step(np.zeros(100, dtype=np.int64))
+        assert (observation[:, 0] == DOOR_SELECTED).all()
+        assert ((observation == DOOR_OPEN).sum(axis=1) == 1).all()
+        assert (observation[np.arange(100), env.winning_door] != DOOR_OPEN).all()
+        assert not dones.any()
+        assert not rewards.any()
+
+    def test_finished_games_are_reset(self):
+        env = VectorMonty(num_envs=50, door_count=3, seed=42)
+        env.reset()
+        env.step(np.zeros(50, dtype=np.int64))
+        observation, rewards, dones, info = env.step(np.full(50, env.switch_action))
+        assert dones.all()
+        assert (rewards[info["won"]] == WIN_SCORE).all()
+        assert (rewards[~info["won"]] == 0).all()
+        assert (observation == DOOR_CLOSED).all()
+
+    def test_switching_on_three_doors_wins_two_thirds(self):
+        env = VectorMonty(num_envs=1000, door_count=3, seed=42)
+        assert abs(_play(env, 20000, switch_when_closed=2) - 2 / 3) < 0.02
+
+    def test_staying_until_the_last_door_wins_most_games(self):
+        env = VectorMonty(num_envs=1000, door_count=10, seed=42)
+        assert abs(_play(env, 20000, switch_when_closed=2) - 0.9) < 0.02
+
+    def test_never_switching_wins_one_in_door_count(self):
+        env = VectorMonty(num_envs=1000, door_count=10, seed=42)
+        assert abs(_play(env, 20000, switch_when_closed=0) - 0.1) < 0.02
+
+    def test_rejects_masked_actions(self):
+        env = VectorMonty(num_envs=2, door_count=3, seed=42)
+        env.reset()
+        try:
+            env.step(np.array([0, env.stay_action]))
+        except ValueError as e:
+            assert str(e) == "Action not allowed in the current state"
+        else:
+            assert False, "Expected ValueError not raised"
+
+    def test_rejects_wrong_number_of_actions(self):
+        env = VectorMonty(num_envs=2, door_count=3, seed=42)
+        try:
+            env.step(np.array([0]))
+        except ValueError as e:
+            assert str(e) == "Need exactly one action per game"
+        else:
+            assert False, "Expected ValueError not raised"
@@ -0,0 +1,57 @@
+import os
+from monty_hall.charts import Chart, Series, learning_curve, render_charts, sweep_charts
+from monty_hall.env.monty import Result
+
+
+def _results(pattern: list[bool], repeat: int) -> list[Result]:
+    return [Result(won=won) for won in pattern * repeat]
+
+
+class TestLearningCurve:
+    def test_counts_wins_per_window(self):
+        results = [Result(won=False)] * 10 + [Result(won=True)] * 10 + [Result(won=True)] * 5
+        series = learning_curve("Agent", results, window=10)
+        assert series.x == [10.0, 20.0]
+        assert series.wins == [0, 10]
+        assert series.games == [10, 10]
+
+
+class TestSweepCharts:
+    def test_builds_every_chart(self):
+        sweep = {
+            3: {"Stander": _results([True, False, False], 100), "AlwaysSwitch": _results([True, True, False], 100)},
+            10: {"Stander": _results([True] + [False] * 9, 30), "AlwaysSwitch": _results([True, False], 150)},
+        }
+        charts = sweep_charts(sweep, window=50)
+        assert len(charts) == 5
+        by_door_count = charts[-1]
+        assert by_door_count.filename == "win_rate_by_door_count.png"
+        stander = next(series for series in by_door_count.series if series.label == "Stander")
+        assert stander.x == [3.0, 10.0]
+        assert stander.wins == [100, 30]
+        assert stander.games == [300, 300]
+
+
+class TestRenderCharts:
+    def _charts(self) -> list[Chart]:
+        return [
+            Chart(
+                filename=f"chart_{i}.png",
+                title=f"Chart {i}",
+                xlabel="Games",
+                series=[Series(label="Agent", x=[1.0, 2.0, 3.0], wins=[1, 2, 3], games=[3, 3, 3])],
+            )
+            for i in range(3)
+        ]
+
+    def test_renders_files_without_a_display(self, tmp_path):
+        paths = render_charts(self._charts(), str(tmp_path / "charts"))
+        assert [os.path.basename(path) for path in paths] == ["chart_0.png", "chart_1.png", "chart_2.png"]
+        for path in paths:
+            with open(path, "rb") as f:
+                assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+    def test_renders_in_worker_pool(self, tmp_path):
+        paths = render_charts(self._charts(), str(tmp_path), workers=2)
+        assert len(paths) == 3
+        assert all(os.path.getsize(path) > 0 for path in paths)
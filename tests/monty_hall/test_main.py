@@ -0,0 +1,64 @@
+import random
+import time
+from monty_hall.agents.non_ai_agents import AlwaysSwitch, Stander
+from monty_hall.env.monty import Monty, Result
+from monty_hall.main import compare_agents_for_duration, repeat_simulation_for
+
+
+class CountingAgent(AlwaysSwitch):
+    def __init__(self) -> None:
+        super().__init__()
+        self.games = 0
+
+    def observe_result(self, result: Result) -> None:
+        self.games += 1
+
+
+class TestRepeatSimulationFor:
+    def test_runs_until_budget_is_spent(self):
+        agent = CountingAgent()
+
+        def clock() -> float:
+            # a game takes exactly one millisecond
+            return agent.games * 0.001
+
+        env = Monty(rng=random.Random(42))
+        run = repeat_simulation_for(env, agent, 0.2, clock=clock, chunk_seconds=0.05)
+        assert run.elapsed >= 0.2
+        # overshoots by at most one chunk
+        assert run.elapsed <= 0.2 + 0.05
+        assert 200 <= len(run.results) <= 250
+        assert run.games_per_second == len(run.results) / run.elapsed
+
+    def test_sizes_chunks_from_measured_throughput(self):
+        agent = CountingAgent()
+        reads: list[float] = []
+
+        def clock() -> float:
+            # a game takes exactly one millisecond
+            reads.append(agent.games * 0.001)
+            return reads[-1]
+
+        env = Monty(rng=random.Random(42))
+        run = repeat_simulation_for(env, agent, 0.5, clock=clock, chunk_seconds=0.1)
+        assert 500 <= len(run.results) <= 501
+        assert len(reads) <= 10
+
+    def test_supports_cpu_time(self):
+        env = Monty(rng=random.Random(42))
+        run = repeat_simulation_for(env, Stander(), 0.05, clock=time.process_time)
+        assert run.results
+
+
+class TestCompareAgentsForDuration:
+    def test_reports_win_rate_and_throughput(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "monty_hall").mkdir()
+        env = Monty(rng=random.Random(42))
+        win_rates, throughput = compare_agents_for_duration(env, [Stander, AlwaysSwitch], 0.05)
+        assert set(win_rates) == set(throughput) == {"Stander", "AlwaysSwitch"}
+        assert all(rate > 0 for rate in throughput.values())
+        output = capsys.readouterr().out
+        assert "Stander: Total games:" in output
+        assert "AlwaysSwitch: Doors: 3" in output
+        assert (tmp_path / "monty_hall" / "results.md").exists()
@@ -0,0 +1,90 @@
+import io
+import multiprocessing
+import random
+from rich.console import Console
+from monty_hall.agents.non_ai_agents import AlwaysSwitch
+from monty_hall.env.monty import Monty
+from monty_hall.main import repeat_simulation_with_progress
+from monty_hall.progress import AgentProgress, ProgressCounters, ProgressDisplay
+
+
+def _add_games(counters: ProgressCounters, slot: int) -> None:
+    for _ in range(10):
+        counters.add(slot, 100, 60)
+
+
+class TestProgressCounters:
+    def test_accumulates_per_slot(self):
+        counters = ProgressCounters(["Stander", "AlwaysSwitch"])
+        counters.add(0, 10, 3)
+        counters.add(1, 10, 7)
+        counters.add(1, 5, 2)
+        assert counters.snapshot() == [(10, 3), (15, 9)]
+
+    def test_shared_with_worker_processes(self):
+        counters = ProgressCounters(["First", "Second"])
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_add_games, args=(counters, slot)) for slot in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert counters.snapshot() == [(1000, 600), (1000, 600)]
+
+    def test_processes_can_share_a_slot(self):
+        counters = ProgressCounters(["Shared"], shared_slots=True)
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_add_games, args=(counters, 0)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert counters.snapshot() == [(2000, 1200)]
+
+    def test_updated_by_runner(self):
+        counters = ProgressCounters(["AlwaysSwitch"])
+        env = Monty(rng=random.Random(42))
+        results = repeat_simulation_with_progress(env, AlwaysSwitch(), 2500, counters, 0, chunk_size=1000)
+        assert len(results) == 2500
+        assert counters.snapshot() == [(2500, sum(result.won for result in results))]
+
+
+class TestAgentProgress:
+    def test_confidence_interval(self):
+        progress = AgentProgress(name="Agent", games=10000, wins=5000, games_per_second=0)
+        assert progress.win_rate == 0.5
+        assert round(progress.confidence_interval, 4) == 0.0098
+
+    def test_no_games(self):
+        progress = AgentProgress(name="Agent", games=0, wins=0, games_per_second=0)
+        assert progress.win_rate == 0
+        assert progress.confidence_interval == 0
+
+
+class TestProgressDisplay:
+    def test_samples_games_per_second_since_last_sample(self):
+        counters = ProgressCounters(["Agent"])
+        display = ProgressDisplay(counters)
+        counters.add(0, 100, 50)
+        first = display.sample()
+        assert first[0].games == 100
+        assert first[0].games_per_second > 0
+        second = display.sample()
+        assert second[0].games_per_second == 0
+
+    def test_renders_live_table(self):
+        output = io.StringIO()
+        counters = ProgressCounters(["AlwaysSwitch"])
+        with ProgressDisplay(counters, refresh_per_second=50, console=Console(file=output, width=120)):
+            counters.add(0, 300, 200)
+        rendered = output.getvalue()
+        assert "AlwaysSwitch" in rendered
+        assert "66.67%" in rendered
+
+    def test_fails_with_invalid_refresh_rate(self):
+        try:
+            ProgressDisplay(ProgressCounters([]), refresh_per_second=0)
+        except ValueError as e:
+            assert str(e) == "Refresh rate must be positive"
+        else:
+            assert False, "Expected ValueError not raised"
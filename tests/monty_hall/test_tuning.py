@@ -0,0 +1,44 @@
+from monty_hall.agents.featurizers import door_counts
+from monty_hall.tuning import Config, config_grid, evaluate_config, successive_halving
+
+
+class TestConfig:
+    def test_grid_covers_every_combination(self):
+        configs = config_grid(alphas=[0.1, 0.2], initial_epsilons=[0.1], decay_rates=[0.99, 1.0])
+        assert len(configs) == 4
+        assert Config(alpha=0.2, initial_epsilon=0.1, decay_rate=1.0) in configs
+
+    def test_builds_agent_with_its_hyperparameters(self):
+        agent = Config(alpha=0.3, initial_epsilon=0.4, decay_rate=0.9).build_agent()
+        assert agent.alpha == 0.3
+        assert agent.epsilon == 0.4
+        assert agent.decay_rate == 0.9
+
+    def test_evaluation_is_reproducible(self):
+        config = Config(alpha=0.1, initial_epsilon=0.2, decay_rate=0.99)
+        assert evaluate_config(config, 200, seed=7) == evaluate_config(config, 200, seed=7)
+
+
+class TestSuccessiveHalving:
+    def test_prunes_to_the_best_config(self):
+        good = Config(alpha=0.1, initial_epsilon=0.1, decay_rate=0.99)
+        random_play = Config(alpha=0.1, initial_epsilon=1.0, decay_rate=1.0, min_epsilon=1.0)
+        never_learns = Config(alpha=0.0, initial_epsilon=0.0, decay_rate=1.0, min_epsilon=0.0)
+        slow = Config(alpha=0.001, initial_epsilon=0.5, decay_rate=1.0, min_epsilon=0.5)
+        search = successive_halving(
+            [random_play, never_learns, good, slow],
+            min_games=400,
+            eta=2,
+            featurizer=door_counts,
+            max_workers=2,
+        )
+        assert search.best == good
+        assert [trial.games for trial in search.trials] == [400] * 4 + [800] * 2
+
+    def test_fails_without_configs(self):
+        try:
+            successive_halving([])
+        except ValueError as e:
+            assert str(e) == "Need at least one config"
+        else:
+            assert False, "Expected ValueError not raised"
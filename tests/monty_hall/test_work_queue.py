@@ -0,0 +1,167 @@
+from monty_hall.work_queue import DONE, LEASED, SweepStore, known_agents, progress_counters, run_cell, run_local_workers, run_worker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TickingClock(FakeClock):
+    """
+    Moves one second forward every time it is read.
+    """
+    def __call__(self) -> float:
+        self.now += 1
+        return self.now
+
+
+class HeartbeatLog(SweepStore):
+    """
+    Records whether the lease was still live at each heartbeat.
+    """
+    def __init__(self, path: str, clock: TickingClock):
+        super().__init__(path, clock=clock)
+        self.lease_was_live: list[bool] = []
+
+    def heartbeat(self, cell_id: int, worker: str, lease_seconds: float) -> bool:
+        expiry = self.next_lease_expiry()
+        self.lease_was_live.append(expiry is not None and self.clock() < expiry)
+        return super().heartbeat(cell_id, worker, lease_seconds)
+
+
+class TestSweepStore:
+    def test_adds_each_cell_once(self, tmp_path):
+        store = SweepStore(str(tmp_path / "sweep.db"))
+        assert store.add_cells(["Stander", "AlwaysSwitch"], [3, 5], [100]) == 4
+        assert store.add_cells(["Stander"], [3, 10], [100]) == 1
+        assert store.remaining() == 5
+
+    def test_claims_each_cell_once(self, tmp_path):
+        store = SweepStore(str(tmp_path / "sweep.db"))
+        store.add_cells(["Stander"], [3, 5], [100])
+        first = store.claim("a", 60)
+        second = store.claim("b", 60)
+        assert first and second
+        assert first.id != second.id
+        assert store.claim("c", 60) is None
+
+    def test_requeues_expired_leases(self, tmp_path):
+        clock = FakeClock()
+        store = SweepStore(str(tmp_path / "sweep.db"), clock=clock)
+        store.add_cells(["Stander"], [3], [100])
+        lost = store.claim("dead", 10)
+        assert lost
+        assert store.claim("alive", 10) is None
+        clock.now += 11
+        reclaimed = store.claim("alive", 10)
+        assert reclaimed
+        assert reclaimed.id == lost.id
+        assert reclaimed.attempts == 2
+        assert not store.heartbeat(lost.id, "dead", 10)
+        assert not store.complete(lost.id, "dead", 5)
+        assert store.complete(reclaimed.id, "alive", 5)
+        assert store.get(reclaimed.id).wins == 5
+
+    def test_heartbeat_keeps_lease(self, tmp_path):
+        clock = FakeClock()
+        store = SweepStore(str(tmp_path / "sweep.db"), clock=clock)
+        store.add_cells(["Stander"], [3], [100])
+        cell = store.claim("a", 10)
+        assert cell
+        clock.now += 8
+        assert store.heartbeat(cell.id, "a", 10)
+        clock.now += 8
+        assert store.claim("b", 10) is None
+        assert store.get(cell.id).status == LEASED
+
+
+class TestWorkers:
+    def test_knows_agents_by_name(self):
+        agents = known_agents()
+        assert "AlwaysSwitch" in agents
+        assert "OptimalPolicy" in agents
+        assert "BaseAgent" not in agents
+        assert "BaseQAgent" not in agents
+
+    def test_worker_completes_every_cell(self, tmp_path):
+        path = str(tmp_path / "sweep.db")
+        store = SweepStore(path)
+        store.add_cells(["Stander", "AlwaysSwitch"], [3], [600])
+        assert run_worker(path, worker="only") == 2
+        cells = store.cells(DONE)
+        assert len(cells) == 2
+        rates = {cell.agent: cell.win_rate for cell in cells}
+        assert abs(rates["Stander"] - 1 / 3) < 0.06
+        assert abs(rates["AlwaysSwitch"] - 2 / 3) < 0.06
+
+    def test_picks_up_cells_of_crashed_workers(self, tmp_path):
+        path = str(tmp_path / "sweep.db")
+        store = SweepStore(path)
+        store.add_cells(["Stander", "AlwaysSwitch"], [3], [100])
+        crashed = store.claim("crashed", 0.5)
+        assert crashed
+        assert run_worker(path, worker="live") == 2
+        assert store.remaining() == 0
+        cell = store.get(crashed.id)
+        assert cell.worker == "live"
+        assert cell.attempts == 2
+
+    def test_renews_lease_by_time(self, tmp_path):
+        store = HeartbeatLog(str(tmp_path / "sweep.db"), clock=TickingClock())
+        store.add_cells(["Stander"], [3], [30])
+        cell = store.claim("slow", 9)
+        assert cell
+        assert run_cell(store, cell, "slow", known_agents()["Stander"], 9)
+        # Each game takes a second of the clock, so a 9 second lease only
+        # survives 30 games if it is renewed every few games.
+        assert len(store.lease_was_live) >= 9
+        assert all(store.lease_was_live)
+        assert store.get(cell.id).status == DONE
+
+    def test_abandons_cell_after_losing_lease(self, tmp_path):
+        clock = TickingClock()
+        store = SweepStore(str(tmp_path / "sweep.db"), clock=clock)
+        store.add_cells(["Stander"], [3], [300])
+        cell = store.claim("slow", 10)
+        assert cell
+        clock.now += 11
+        assert store.claim("fast", 10)
+        assert not run_cell(store, cell, "slow", known_agents()["Stander"], 10)
+        assert store.get(cell.id).worker == "fast"
+
+    def test_local_workers_share_the_store(self, tmp_path):
+        path = str(tmp_path / "sweep.db")
+        store = SweepStore(path)
+        store.add_cells(["Stander", "AlwaysSwitch", "Random"], [3, 4], [200, 400])
+        run_local_workers(path, workers=3)
+        cells = store.cells(DONE)
+        assert len(cells) == 12
+        assert all(cell.attempts == 1 for cell in cells)
+        assert store.remaining() == 0
+
+    def test_local_workers_report_progress(self, tmp_path):
+        path = str(tmp_path / "sweep.db")
+        store = SweepStore(path)
+        store.add_cells(["Stander", "AlwaysSwitch"], [3, 4], [300])
+        counters = progress_counters(store)
+        assert counters.agent_names == ["AlwaysSwitch", "Stander"]
+        run_local_workers(path, workers=2, counters=counters)
+        totals = {agent: (0, 0) for agent in counters.agent_names}
+        for cell in store.cells(DONE):
+            games, wins = totals[cell.agent]
+            totals[cell.agent] = (games + cell.games, wins + (cell.wins or 0))
+        assert counters.snapshot() == [totals["AlwaysSwitch"], totals["Stander"]]
+
+    def test_local_workers_raise_when_a_worker_fails(self, tmp_path):
+        path = str(tmp_path / "sweep.db")
+        store = SweepStore(path)
+        store.add_cells(["NoSuchAgent"], [3], [100])
+        try:
+            run_local_workers(path, workers=1)
+        except RuntimeError as e:
+            assert str(e) == "Sweep worker failed"
+        else:
+            assert False, "Expected RuntimeError not raised"